@@ -6,6 +6,9 @@ from pathlib import Path
 from gda.errors import ReleaseNotFoundError
 from gda.protocols.github import AssetInfo, ReleaseInfo
 
+# Digest served for unknown URLs, matching download_asset's empty payload
+_EMPTY_SHA256 = hashlib.sha256(b"", usedforsecurity=False).hexdigest()
+
 
 class MockGitHubClient:
     """Mock implementation of GitHubClientProtocol for testing."""
@@ -14,7 +17,10 @@ class MockGitHubClient:
         """Initialize mock client with empty state."""
         self.releases: dict[tuple[str, str], ReleaseInfo] = {}
         self.assets: dict[str, bytes] = {}
+        self.asset_hashes: dict[str, str] = {}
         self.upload_history: list[tuple[str, str, str, bytes]] = []
+        self.download_history: list[str] = []
+        self._revision = 0
 
     def add_release(
         self,
@@ -37,7 +43,7 @@ class MockGitHubClient:
         asset_list = []
         for name, content in assets or []:
             url = f"https://github.com/{repo}/releases/download/{tag}/{name}"
-            self.assets[url] = content
+            self._store_asset(url, content)
             asset_list.append(
                 AssetInfo(
                     name=name,
@@ -47,10 +53,28 @@ class MockGitHubClient:
                 )
             )
 
-        release = ReleaseInfo(id=release_id, tag_name=tag, name=tag, assets=asset_list)
+        release = ReleaseInfo(
+            id=release_id,
+            tag_name=tag,
+            name=tag,
+            assets=asset_list,
+            etag=self._next_etag(),
+        )
         self.releases[(repo, tag)] = release
         return release
 
+    def _next_etag(self) -> str:
+        """Return a fresh ETag for a new or modified release."""
+        self._revision += 1
+        return f'"mock-{self._revision}"'
+
+    def _store_asset(self, url: str, content: bytes) -> None:
+        """Store asset content and precompute its SHA256 digest."""
+        self.assets[url] = content
+        self.asset_hashes[url] = hashlib.sha256(
+            content, usedforsecurity=False
+        ).hexdigest()
+
     def get_release(self, repo: str, tag: str) -> ReleaseInfo:
         """Get release information by tag.
 
@@ -69,6 +93,27 @@ class MockGitHubClient:
             raise ReleaseNotFoundError(repo, tag)
         return self.releases[key]
 
+    def get_release_if_modified(
+        self, repo: str, tag: str, etag: str
+    ) -> ReleaseInfo | None:
+        """Get release information unless it matches a known ETag.
+
+        Args:
+            repo: Repository in "owner/repo" format.
+            tag: Release tag name.
+            etag: ETag of a previously fetched copy of the release.
+
+        Returns:
+            Release metadata, or None if the release is unchanged.
+
+        Raises:
+            ReleaseNotFoundError: If the release does not exist.
+        """
+        release = self.get_release(repo, tag)
+        if release.etag == etag:
+            return None
+        return release
+
     def download_asset(self, url: str, dest: Path) -> None:
         """Download a release asset.
 
@@ -76,9 +121,23 @@ class MockGitHubClient:
             url: Asset download URL.
             dest: Destination file path.
         """
+        self.download_and_hash(url, dest)
+
+    def download_and_hash(self, url: str, dest: Path) -> str:
+        """Download a release asset and return its hash.
+
+        Args:
+            url: Asset download URL.
+            dest: Destination file path.
+
+        Returns:
+            SHA256 hex digest.
+        """
+        self.download_history.append(url)
         content = self.assets.get(url, b"")
         dest.parent.mkdir(parents=True, exist_ok=True)
         dest.write_bytes(content)
+        return hashlib.sha256(content, usedforsecurity=False).hexdigest()
 
     def get_asset_hash(self, url: str) -> str:
         """Get SHA256 hash of a remote asset.
@@ -89,8 +148,7 @@ class MockGitHubClient:
         Returns:
             SHA256 hex digest.
         """
-        content = self.assets.get(url, b"")
-        return hashlib.sha256(content).hexdigest()
+        return self.asset_hashes.get(url, _EMPTY_SHA256)
 
     def create_release(self, repo: str, tag: str, name: str) -> ReleaseInfo:
         """Create a new release.
@@ -103,7 +161,9 @@ class MockGitHubClient:
         Returns:
             Created release metadata.
         """
-        release = ReleaseInfo(id=1, tag_name=tag, name=name, assets=[])
+        release = ReleaseInfo(
+            id=1, tag_name=tag, name=name, assets=[], etag=self._next_etag()
+        )
         self.releases[(repo, tag)] = release
         return release
 
@@ -123,8 +183,11 @@ class MockGitHubClient:
             Uploaded asset metadata.
         """
         self.upload_history.append((repo, str(release_id), name, content))
+        for (release_repo, _tag), release in self.releases.items():
+            if release_repo == repo and release.id == release_id:
+                release.etag = self._next_etag()
         url = f"https://github.com/{repo}/releases/download/mock/{name}"
-        self.assets[url] = content
+        self._store_asset(url, content)
 
         return AssetInfo(
             name=name,
@@ -133,6 +196,25 @@ class MockGitHubClient:
             content_type=content_type,
         )
 
+    def upload_asset_stream(
+        self, repo: str, release_id: int, name: str, path: Path, content_type: str
+    ) -> AssetInfo:
+        """Upload a file to a release.
+
+        Args:
+            repo: Repository in "owner/repo" format.
+            release_id: Release ID (ignored in mock).
+            name: Asset filename.
+            path: Path to the file to upload.
+            content_type: MIME type.
+
+        Returns:
+            Uploaded asset metadata.
+        """
+        return self.upload_asset(
+            repo, release_id, name, path.read_bytes(), content_type
+        )
+
     def close(self) -> None:
         """Close the mock client (no-op)."""
         pass
@@ -1,5 +1,6 @@
 """Init command implementation."""
 
+import re
 from pathlib import Path
 from typing import Optional
 
@@ -22,6 +23,9 @@ _GITIGNORE_BLOCK = """# GDA cache and build artifacts
 .gda/
 """
 
+# Matches a ".gda" or ".gda/" line, ignoring surrounding whitespace
+_GDA_IGNORE_RE = re.compile(r"(?m)^\s*\.gda/?\s*$")
+
 
 def _render_manifest(repository: str, version: str) -> str:
     return _MANIFEST_TEMPLATE.format(repository=repository, version=version)
@@ -35,10 +39,7 @@ def _write_manifest(path: Path, content: str, overwrite: bool) -> bool:
 
 
 def _gitignore_has_gda(content: str) -> bool:
-    for line in content.splitlines():
-        if line.strip() in {".gda", ".gda/"}:
-            return True
-    return False
+    return _GDA_IGNORE_RE.search(content) is not None
 
 
 def _ensure_gitignore(path: Path) -> bool:
@@ -46,14 +47,15 @@ def _ensure_gitignore(path: Path) -> bool:
     if _gitignore_has_gda(content):
         return False
 
-    updated = content
-    if updated and not updated.endswith("\n"):
-        updated += "\n"
-    if updated:
-        updated += "\n"
-    updated += _GITIGNORE_BLOCK
+    # Separate the block from existing entries by one blank line
+    if not content:
+        separator = ""
+    elif content.endswith("\n"):
+        separator = "\n"
+    else:
+        separator = "\n\n"
 
-    path.write_text(updated, encoding="utf-8")
+    path.write_text(f"{content}{separator}{_GITIGNORE_BLOCK}", encoding="utf-8")
     return True
 
 
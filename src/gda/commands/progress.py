@@ -0,0 +1,39 @@
+"""Shared progress display for per-asset command loops."""
+
+from rich.console import Console
+from rich.progress import Progress, SpinnerColumn, TaskID, TextColumn
+
+
+def asset_progress(console: Console) -> Progress:
+    """Create a progress display with one line per asset.
+
+    Rich coalesces task updates and redraws at a fixed rate, which keeps
+    output cheap when many assets change state, including from worker
+    threads.
+
+    Args:
+        console: Console to render on.
+
+    Returns:
+        Progress display; use as a context manager.
+    """
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("{task.description}"),
+        console=console,
+    )
+
+
+def add_finished_task(progress: Progress, description: str) -> TaskID:
+    """Add a task that is already complete, such as a skipped asset.
+
+    Args:
+        progress: Progress display to add the task to.
+        description: Task description (Rich markup).
+
+    Returns:
+        ID of the added task.
+    """
+    task = progress.add_task(description, total=1)
+    progress.update(task, completed=1)
+    return task
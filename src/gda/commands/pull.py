@@ -1,14 +1,18 @@
 """Pull command implementation."""
 
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 
 import typer
 from rich.console import Console
+from rich.progress import Progress, TaskID
 
+from gda.commands.progress import asset_progress
 from gda.commands.resolve import _resolve_impl
 from gda.context import AppContext
 from gda.errors import GDAError, LockfileNotFoundError
-from gda.models.lockfile import Lockfile
+from gda.models.lockfile import LockedAsset, Lockfile
 from gda.models.manifest import Manifest
 from gda.protocols.archive import ArchiveServiceProtocol
 from gda.protocols.github import GitHubClientProtocol
@@ -18,6 +22,9 @@ from gda.services.sync import SyncService
 
 console = Console()
 
+# Upper bound on concurrent asset downloads
+_MAX_PULL_WORKERS = 8
+
 
 def pull(
     ctx: typer.Context,
@@ -50,6 +57,104 @@ def pull(
         raise typer.Exit(1)
 
 
+def _pull_one(
+    sync: SyncService,
+    progress: Progress,
+    task: TaskID,
+    name: str,
+    asset: LockedAsset,
+    dest: Path,
+    force: bool,
+    prune: bool,
+    source: tuple[Path, list[str]] | None = None,
+) -> list[str] | None:
+    """Verify and pull a single asset.
+
+    Runs on a worker thread, so it must not mutate shared lockfile state.
+
+    Args:
+        source: Destination and files of an already pulled asset with the
+            same hash; when given, files are copied from it instead of
+            downloaded.
+
+    Returns:
+        Extracted file list, or None if the asset was already up to date.
+    """
+    if not force and sync.verify_asset(asset, dest):
+        return None
+
+    if source is not None:
+        progress.update(task, description=f"[dim]⧉[/dim] Copying {name}...")
+        files = sync.copy_asset(source[0], dest, source[1])
+    else:
+        progress.update(task, description=f"[dim]↓[/dim] Downloading {name}...")
+        # Verification already failed (or was skipped), so don't repeat it
+        files = sync.pull_asset(asset, dest, force=True)
+
+    if prune:
+        sync._prune_directory(dest, set(files))
+
+    return files
+
+
+def _pull_group(
+    sync: SyncService,
+    progress: Progress,
+    tasks: dict[str, TaskID],
+    group: list[tuple[str, LockedAsset, Path]],
+    force: bool,
+    prune: bool,
+    source: tuple[Path, list[str]] | None = None,
+) -> list[list[str] | None]:
+    """Pull a group of assets one after another on a single worker.
+
+    Args:
+        tasks: Progress task per asset name.
+        group: (name, asset, destination) in manifest order.
+        source: Passed to _pull_one; only given for single-asset groups.
+
+    Returns:
+        _pull_one result per asset, in group order.
+    """
+    return [
+        _pull_one(sync, progress, tasks[name], name, asset, dest, force, prune, source)
+        for name, asset, dest in group
+    ]
+
+
+def _group_overlapping(
+    pending: list[tuple[str, LockedAsset, Path]],
+) -> list[list[tuple[str, LockedAsset, Path]]]:
+    """Group assets whose destinations are equal or nested in each other.
+
+    Pulling an asset clears and prunes its destination, so assets sharing a
+    directory tree must not run concurrently. Each group keeps manifest
+    order, which is the order a sequential pull would apply them in.
+
+    Args:
+        pending: (name, asset, destination) in manifest order.
+
+    Returns:
+        Groups ordered by their first asset's position in the manifest.
+    """
+    parts = [Path(os.path.normpath(dest)).parts for _name, _asset, dest in pending]
+    # Sorting by path components puts every nested destination directly
+    # after the directory containing it
+    root_of = [0] * len(pending)
+    root: tuple[str, ...] | None = None
+    root_index = 0
+    for index in sorted(range(len(pending)), key=parts.__getitem__):
+        if root is None or parts[index][: len(root)] != root:
+            root = parts[index]
+            root_index = index
+        root_of[index] = root_index
+
+    groups: dict[int, list[tuple[str, LockedAsset, Path]]] = {}
+    for index, entry in enumerate(pending):
+        groups.setdefault(root_of[index], []).append(entry)
+    return list(groups.values())
+
+
 def _pull_impl(
     ctx: typer.Context, manifest_path: Path, force: bool, prune: bool
 ) -> None:
@@ -72,19 +177,16 @@ def _pull_impl(
             console.print(
                 "[dim]Lockfile version mismatch. Resolving release metadata...[/dim]"
             )
-        _resolve_impl(ctx, manifest_path)
-        lockfile = Lockfile.load(lockfile_path)
+        lockfile = _resolve_impl(ctx, manifest_path)
 
-    # Build destination map
-    working_dir = manifest_path.parent.resolve()
-    destinations = {
-        name: working_dir / asset.destination for name, asset in manifest.assets.items()
-    }
+    working_dir = manifest_path.parent
+    if not working_dir.is_absolute():
+        working_dir = working_dir.resolve()
 
     context = ctx.obj if isinstance(ctx.obj, AppContext) else None
     client: GitHubClientProtocol
     archive: ArchiveServiceProtocol
-    client_to_close: GitHubClient | None = None
+    client_to_close: GitHubClientProtocol | None = None
     if context is None:
         client = GitHubClient()
         archive = ArchiveService()
@@ -98,27 +200,96 @@ def _pull_impl(
     try:
         console.print(f"\n[bold]Pulling {len(lockfile.assets)} assets...[/bold]\n")
 
+        pending: list[tuple[str, LockedAsset, Path]] = []
         for name, asset in lockfile.assets.items():
-            dest = destinations.get(name)
-            if dest is None:
+            manifest_asset = manifest.assets.get(name)
+            if manifest_asset is None:
                 console.print(f"[yellow]⚠[/yellow] Skipping {name}: not in manifest")
                 continue
+            pending.append((name, asset, working_dir / manifest_asset.destination))
 
-            if not force and sync.verify_asset(asset, dest):
-                console.print(f"[dim]✓[/dim] {name} (up to date)")
-                continue
+        if pending:
+            groups = _group_overlapping(pending)
+            workers = min(_MAX_PULL_WORKERS, len(groups))
+            with (
+                asset_progress(console) as progress,
+                ThreadPoolExecutor(max_workers=workers) as executor,
+            ):
+                tasks = {
+                    name: progress.add_task(f"[dim]…[/dim] {name}", total=1)
+                    for name, _asset, _dest in pending
+                }
+                futures: dict[
+                    Future[list[list[str] | None]],
+                    list[tuple[str, LockedAsset, Path]],
+                ] = {}
+                # Assets sharing an archive hash are downloaded once, then copied.
+                # Only single-asset groups take part: their destinations are
+                # disjoint from every other, so a copy never clears its source
+                duplicates: dict[str, list[tuple[str, LockedAsset, Path]]] = {}
+                for group in groups:
+                    if len(group) == 1:
+                        _name, asset, _dest = group[0]
+                        if asset.sha256 in duplicates:
+                            duplicates[asset.sha256].append(group[0])
+                            continue
+                        duplicates[asset.sha256] = []
+                    future = executor.submit(
+                        _pull_group, sync, progress, tasks, group, force, prune
+                    )
+                    futures[future] = group
 
-            console.print(f"[dim]↓[/dim] Downloading {name}...")
-            files = sync.pull_asset(asset, dest, force=force)
-            console.print(f"[green]✓[/green] {name} ({len(files)} files)")
+                # Lockfile mutation stays on this thread
+                while futures:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        group = futures.pop(future)
+                        for (name, asset, dest), files in zip(group, future.result()):
+                            task = tasks[name]
+                            if files is None:
+                                progress.update(
+                                    task,
+                                    completed=1,
+                                    description=f"[dim]✓[/dim] {name} (up to date)",
+                                )
+                            else:
+                                progress.update(
+                                    task,
+                                    completed=1,
+                                    description=(
+                                        f"[green]✓[/green] {name} ({len(files)} files)"
+                                    ),
+                                )
 
-            # Update lockfile with extracted files
-            if asset.files != files:
-                asset.files = files
-                lockfile_updated = True
+                                # Update lockfile with extracted files
+                                if asset.files != files:
+                                    asset.files = files
+                                    lockfile_updated = True
 
-            if prune:
-                sync._prune_directory(dest, set(files))
+                        if len(group) != 1:
+                            continue
+                        dups = duplicates.pop(asset.sha256, [])
+                        source = None
+                        if files is not None:
+                            source = (dest, list(files))
+                        elif dups:
+                            # Files verified in place may have been edited, so
+                            # only an archive extracted this run is copied; the
+                            # next duplicate downloads and the rest wait on it
+                            duplicates[asset.sha256] = dups[1:]
+                            dups = dups[:1]
+                        for dup in dups:
+                            dup_future = executor.submit(
+                                _pull_group,
+                                sync,
+                                progress,
+                                tasks,
+                                [dup],
+                                force,
+                                prune,
+                                source,
+                            )
+                            futures[dup_future] = [dup]
 
         # Persist updated lockfile
         if lockfile_updated:
@@ -128,5 +299,6 @@ def _pull_impl(
         console.print("\n[green]✓[/green] Pull complete")
 
     finally:
+        sync.cleanup_cache()
         if client_to_close is not None:
             client_to_close.close()
@@ -1,10 +1,17 @@
 """Push command implementation."""
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import replace
 from pathlib import Path
 
 import typer
 from rich.console import Console
+from rich.progress import Progress
 
+from gda import json_io
+from gda.commands.progress import add_finished_task, asset_progress
 from gda.context import AppContext
 from gda.errors import GDAError
 from gda.models.manifest import Manifest
@@ -28,7 +35,7 @@ def push(
         False,
         "--force",
         "-f",
-        help="Overwrite existing release assets.",
+        help="Rebuild archives and overwrite existing release assets.",
     ),
     dry_run: bool = typer.Option(
         False,
@@ -49,6 +56,114 @@ def push(
         raise typer.Exit(1)
 
 
+def _cached_build(zip_path: Path, cache_path: Path, fingerprint: str) -> str | None:
+    """Return the cached archive hash if the source tree is unchanged.
+
+    The archive's size and modification time must also match the ones
+    recorded, so a zip left half-written by an interrupted rebuild is never
+    taken for the one the recorded hash describes.
+    """
+    try:
+        stat = zip_path.stat()
+        data = json_io.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+        return None
+    if data.get("size") != stat.st_size or data.get("mtime_ns") != stat.st_mtime_ns:
+        return None
+    sha256 = data.get("sha256")
+    return sha256 if isinstance(sha256, str) else None
+
+
+def _save_build(
+    cache_path: Path, zip_path: Path, fingerprint: str, sha256: str
+) -> None:
+    """Record the fingerprint of the tree an archive was built from."""
+    stat = zip_path.stat()
+    data = {
+        "fingerprint": fingerprint,
+        "sha256": sha256,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+    cache_path.write_bytes(json_io.dumps(data, indent=False))
+
+
+def _build_in_worker(
+    source_dir: Path, zip_path: Path, excludes: list[str], max_workers: int
+) -> str:
+    """Build one archive in a worker process.
+
+    Module-level so it pickles by reference; the service is created here
+    rather than shipped from the parent, with its compression threads
+    capped so concurrent workers do not oversubscribe the CPUs.
+    """
+    return ArchiveService(max_workers=max_workers).create_zip(
+        source_dir, zip_path, excludes
+    )
+
+
+def _build_archives(
+    archive: ArchiveServiceProtocol,
+    stale: list[tuple[str, Path, Path, list[str], str]],
+    progress: Progress,
+) -> list[tuple[str, Path, str, str]]:
+    """Build archives, compressing several assets in parallel processes.
+
+    Args:
+        archive: Archive service used when only one ZIP is built; parallel
+            builds create an ArchiveService in each worker process.
+        stale: (name, source_dir, zip_path, excludes, fingerprint) per asset.
+        progress: Progress display receiving one task per archive.
+
+    Returns:
+        (name, zip_path, sha256, fingerprint) per built asset.
+    """
+    tasks = {
+        zip_path: progress.add_task(
+            f"[dim]📦[/dim] Building {zip_path.name}...", total=1
+        )
+        for _name, _source_dir, zip_path, _excludes, _fp in stale
+    }
+
+    def finish(zip_path: Path, sha256: str) -> None:
+        progress.update(
+            tasks[zip_path],
+            completed=1,
+            description=f"[green]✓[/green] Built {zip_path.name} ({sha256[:16]}...)",
+        )
+
+    built: list[tuple[str, Path, str, str]] = []
+    if len(stale) <= 1:
+        # Not worth spawning worker processes for a single archive
+        for name, source_dir, zip_path, excludes, fingerprint in stale:
+            sha256 = archive.create_zip(source_dir, zip_path, excludes)
+            finish(zip_path, sha256)
+            built.append((name, zip_path, sha256, fingerprint))
+        return built
+
+    cpus = os.cpu_count() or 1
+    workers = min(len(stale), cpus)
+    # Share the CPUs between processes and their compression threads
+    threads = max(1, cpus // workers)
+    # Spawn rather than fork: the progress display runs a refresh thread
+    spawn = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=spawn) as executor:
+        futures = {
+            executor.submit(
+                _build_in_worker, source_dir, zip_path, excludes, threads
+            ): (name, zip_path, fingerprint)
+            for name, source_dir, zip_path, excludes, fingerprint in stale
+        }
+        for future in as_completed(futures):
+            name, zip_path, fingerprint = futures[future]
+            sha256 = future.result()
+            finish(zip_path, sha256)
+            built.append((name, zip_path, sha256, fingerprint))
+    return built
+
+
 def _push_impl(
     ctx: typer.Context, manifest_path: Path, force: bool, dry_run: bool
 ) -> None:
@@ -68,21 +183,39 @@ def _push_impl(
 
     # Build archives
     archives: dict[str, tuple[Path, str]] = {}
+    stale: list[tuple[str, Path, Path, list[str], str]] = []
 
     console.print(f"\n[bold]Building {len(manifest.assets)} archives...[/bold]\n")
 
-    for name, asset in manifest.assets.items():
-        source_dir = working_dir / asset.source
-        if not source_dir.exists():
-            console.print(f"[yellow]⚠[/yellow] Skipping {name}: source not found")
-            continue
+    with asset_progress(console) as progress:
+        for name, asset in manifest.assets.items():
+            source_dir = working_dir / asset.source
+            if not source_dir.exists():
+                console.print(f"[yellow]⚠[/yellow] Skipping {name}: source not found")
+                continue
+
+            zip_path = build_dir / f"{name}.zip"
+            cache_path = build_dir / f"{name}.json"
+            fingerprint = archive.fingerprint(source_dir, asset.excludes)
+
+            sha256 = None if force else _cached_build(zip_path, cache_path, fingerprint)
+            if sha256 is not None:
+                archives[name] = (zip_path, sha256)
+                add_finished_task(progress, f"[dim]✓[/dim] {zip_path.name} (unchanged)")
+                continue
+
+            # Drop the entry first so an interrupted rebuild leaves no cache hit
+            cache_path.unlink(missing_ok=True)
+            stale.append((name, source_dir, zip_path, asset.excludes, fingerprint))
 
-        zip_path = build_dir / f"{name}.zip"
-        console.print(f"[dim]📦[/dim] Building {zip_path.name}...")
+        for name, zip_path, sha256, fingerprint in _build_archives(
+            archive, stale, progress
+        ):
+            _save_build(build_dir / f"{name}.json", zip_path, fingerprint, sha256)
+            archives[name] = (zip_path, sha256)
 
-        sha256 = archive.create_zip(source_dir, zip_path, asset.excludes)
-        archives[name] = (zip_path, sha256)
-        console.print(f"[green]✓[/green] {zip_path.name} ({sha256[:16]}...)")
+    # Keep manifest order regardless of build completion order
+    archives = {name: archives[name] for name in manifest.assets if name in archives}
 
     if dry_run:
         console.print("\n[yellow]Dry run - no uploads performed[/yellow]")
@@ -94,7 +227,7 @@ def _push_impl(
 
     # Upload to GitHub
     client: GitHubClientProtocol
-    client_to_close: GitHubClient | None = None
+    client_to_close: GitHubClientProtocol | None = None
     if context is None:
         client = GitHubClient()
         client_to_close = client
@@ -105,41 +238,57 @@ def _push_impl(
             f"\n[bold]Uploading to {manifest.repository}@{manifest.version}...[/bold]\n"
         )
 
-        # Get or create release
-        try:
-            release = client.get_release(manifest.repository, manifest.version)
-            console.print(f"[dim]Using existing release: {release.name}[/dim]")
-        except GDAError:
-            console.print(f"[dim]Creating release {manifest.version}...[/dim]")
-            release = client.create_release(
-                manifest.repository,
-                manifest.version,
-                manifest.version,
-            )
+        # Get or create release, reusing one already seen in this session
+        release_cache = context.release_cache if context is not None else {}
+        release_key = (manifest.repository, manifest.version)
+        release = release_cache.get(release_key)
+        if release is not None:
+            console.print(f"[dim]Using cached release: {release.name}[/dim]")
+        else:
+            try:
+                release = client.get_release(manifest.repository, manifest.version)
+                console.print(f"[dim]Using existing release: {release.name}[/dim]")
+            except GDAError:
+                console.print(f"[dim]Creating release {manifest.version}...[/dim]")
+                release = client.create_release(
+                    manifest.repository,
+                    manifest.version,
+                    manifest.version,
+                )
+            # Copy so recording uploads never mutates the client's objects
+            release = replace(release, assets=list(release.assets))
+            release_cache[release_key] = release
 
         # Check existing assets
-        existing = {asset.name for asset in release.assets}
+        existing = {asset.name: asset for asset in release.assets}
 
-        for _name, (zip_path, _sha256) in archives.items():
-            asset_name = zip_path.name
+        with asset_progress(console) as progress:
+            for _name, (zip_path, _sha256) in archives.items():
+                asset_name = zip_path.name
 
-            if asset_name in existing and not force:
-                console.print(
-                    f"[yellow]⚠[/yellow] {asset_name} already exists (use --force)"
-                )
-                continue
+                if asset_name in existing and not force:
+                    add_finished_task(
+                        progress,
+                        f"[yellow]⚠[/yellow] {asset_name} already exists (use --force)",
+                    )
+                    continue
 
-            console.print(f"[dim]↑[/dim] Uploading {asset_name}...")
-            content = zip_path.read_bytes()
-
-            client.upload_asset(
-                manifest.repository,
-                release.id,
-                asset_name,
-                content,
-                "application/zip",
-            )
-            console.print(f"[green]✓[/green] Uploaded {asset_name}")
+                task = progress.add_task(
+                    f"[dim]↑[/dim] Uploading {asset_name}...", total=1
+                )
+                existing[asset_name] = client.upload_asset_stream(
+                    manifest.repository,
+                    release.id,
+                    asset_name,
+                    zip_path,
+                    "application/zip",
+                )
+                release.assets = list(existing.values())
+                progress.update(
+                    task,
+                    completed=1,
+                    description=f"[green]✓[/green] Uploaded {asset_name}",
+                )
 
         console.print("\n[green]✓[/green] Push complete")
 
@@ -11,6 +11,7 @@ from gda.models.lockfile import LockedAsset, Lockfile
 from gda.models.manifest import Manifest
 from gda.protocols.github import GitHubClientProtocol
 from gda.services.github import GitHubClient
+from gda.services.release_cache import CachingGitHubClient
 
 console = Console()
 
@@ -23,6 +24,11 @@ def resolve(
         "-m",
         help="Path to manifest file.",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the cached release metadata.",
+    ),
 ) -> None:
     """Resolve dependencies and update gda.lock.
 
@@ -30,14 +36,20 @@ def resolve(
     with exact URLs and hashes for each asset.
     """
     try:
-        _resolve_impl(ctx, manifest_path)
+        _resolve_impl(ctx, manifest_path, use_cache=not no_cache)
     except GDAError as e:
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
 
 
-def _resolve_impl(ctx: typer.Context, manifest_path: Path) -> None:
-    """Implementation of resolve command."""
+def _resolve_impl(
+    ctx: typer.Context, manifest_path: Path, use_cache: bool = True
+) -> Lockfile:
+    """Implementation of resolve command.
+
+    Returns:
+        The lockfile that was written.
+    """
     console.print(f"[dim]Loading manifest from {manifest_path}...[/dim]")
     manifest = Manifest.load(manifest_path)
 
@@ -45,12 +57,15 @@ def _resolve_impl(ctx: typer.Context, manifest_path: Path) -> None:
 
     context = ctx.obj if isinstance(ctx.obj, AppContext) else None
     client: GitHubClientProtocol
-    client_to_close: GitHubClient | None = None
+    client_to_close: GitHubClientProtocol | None = None
     if context is None:
         client = GitHubClient()
         client_to_close = client
     else:
         client = context.github_client
+    if use_cache:
+        cache_dir = manifest_path.parent.resolve() / ".gda" / "releases"
+        client = CachingGitHubClient(client, cache_dir)
     try:
         release = client.get_release(manifest.repository, manifest.version)
         console.print(f"[green]✓[/green] Found release: {release.name}")
@@ -86,6 +101,7 @@ def _resolve_impl(ctx: typer.Context, manifest_path: Path) -> None:
         lockfile.save(lockfile_path)
 
         console.print(f"\n[green]✓[/green] Wrote {lockfile_path}")
+        return lockfile
 
     finally:
         if client_to_close is not None:
@@ -1,16 +1,46 @@
 """Application context for dependency injection."""
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 
 from gda.protocols.archive import ArchiveServiceProtocol
-from gda.protocols.github import GitHubClientProtocol
+from gda.protocols.github import GitHubClientProtocol, ReleaseInfo
 
 
 @dataclass
 class AppContext:
-    """Application context holding dependencies."""
+    """Application context holding dependencies.
 
-    github_client: GitHubClientProtocol
-    archive_service: ArchiveServiceProtocol
+    Services are built from their factories on first access, so commands
+    that never touch GitHub or archives do not pay for creating them.
+
+    release_cache holds releases push has fetched or created, with the
+    assets it uploaded, for commands run against the same context. It lives
+    in memory only: each gda process starts with an empty cache, so it only
+    helps callers that invoke several commands with one context.
+    """
+
+    github_client_factory: Callable[[], GitHubClientProtocol]
+    archive_service_factory: Callable[[], ArchiveServiceProtocol]
     working_dir: Path = field(default_factory=Path.cwd)
+    release_cache: dict[tuple[str, str], ReleaseInfo] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    @cached_property
+    def github_client(self) -> GitHubClientProtocol:
+        """GitHub client, created on first access."""
+        return self.github_client_factory()
+
+    @cached_property
+    def archive_service(self) -> ArchiveServiceProtocol:
+        """Archive service, created on first access."""
+        return self.archive_service_factory()
+
+    def close(self) -> None:
+        """Close the GitHub client, if it was ever created."""
+        client = self.__dict__.get("github_client")
+        if client is not None:
+            client.close()
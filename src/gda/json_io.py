@@ -0,0 +1,52 @@
+"""JSON encoding helpers with optional orjson acceleration."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency (gda[fast])
+    _HAS_ORJSON = False
+else:
+    _HAS_ORJSON = True
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 bytes.
+
+    Returns:
+        Parsed value.
+
+    Raises:
+        ValueError: If the document is invalid JSON or not valid UTF-8.
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = True) -> bytes:
+    """Serialize a value as UTF-8 JSON with a trailing newline.
+
+    Args:
+        obj: Value to serialize.
+        indent: Pretty-print with two-space indentation. Compact output is
+            smaller and faster to write, for files no one reads by hand.
+
+    Returns:
+        Encoded JSON document.
+    """
+    if _HAS_ORJSON:
+        option = orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        encoded: bytes = orjson.dumps(obj, option=option)
+        return encoded
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return (text + "\n").encode("utf-8")
@@ -59,10 +59,12 @@ def main(
 ) -> None:
     """GDA - GitHub Data Assets manager."""
     if ctx.obj is None:
-        ctx.obj = AppContext(
-            github_client=GitHubClient(),
-            archive_service=ArchiveService(),
+        context = AppContext(
+            github_client_factory=GitHubClient,
+            archive_service_factory=ArchiveService,
         )
+        ctx.obj = context
+        ctx.call_on_close(context.close)
 
 
 # Register resolve command
@@ -0,0 +1,34 @@
+"""Field checks shared by the manifest and lockfile parsers."""
+
+from collections.abc import Callable
+from typing import Any
+
+from gda.errors import GDAError
+
+
+def require(
+    data: dict[str, Any],
+    field: str,
+    error: Callable[[str], GDAError],
+    asset: str | None = None,
+) -> Any:
+    """Return a required field, raising if it is missing or empty.
+
+    Args:
+        data: Mapping being validated.
+        field: Required key.
+        error: Error type to raise, given the message.
+        asset: Name of the asset the mapping describes, if any.
+
+    Returns:
+        The field's value.
+
+    Raises:
+        GDAError: The given error type, if the field is missing or empty.
+    """
+    value = data.get(field)
+    if not value:
+        if asset is None:
+            raise error(f"Missing required field: {field}")
+        raise error(f"Asset '{asset}' missing required field: {field}")
+    return value
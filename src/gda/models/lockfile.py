@@ -1,14 +1,27 @@
 """Lockfile model representing gda.lock state."""
 
-import json
+import codecs
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from gda import json_io
 from gda.errors import LockfileCorruptedError, LockfileNotFoundError
+from gda.models._validate import require
 
 
-@dataclass
+def _starts_like_object(content: bytes | str) -> bool:
+    """Check if the first significant character opens a JSON object.
+
+    A leading UTF-8 byte order mark is left for the parser to handle.
+    """
+    if isinstance(content, str):
+        return content.lstrip().startswith(("{", "\ufeff"))
+    return content.lstrip().startswith((b"{", codecs.BOM_UTF8))
+
+
+@dataclass(slots=True)
 class LockedAsset:
     """Locked asset state."""
 
@@ -18,7 +31,7 @@ class LockedAsset:
     files: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Lockfile:
     """Lockfile state from gda.lock."""
 
@@ -42,10 +55,29 @@ class Lockfile:
         if not path.exists():
             raise LockfileNotFoundError(str(path))
 
+        return cls.loads(path.read_bytes())
+
+    @classmethod
+    def loads(cls, content: bytes | str) -> "Lockfile":
+        """Parse lockfile content already in memory.
+
+        Args:
+            content: JSON document, as bytes or text.
+
+        Returns:
+            Parsed Lockfile.
+
+        Raises:
+            LockfileCorruptedError: If the content is invalid.
+        """
+        # A lockfile is always an object; reject anything else without parsing
+        if not _starts_like_object(content):
+            raise LockfileCorruptedError("JSON parse error: expected an object")
+
         try:
-            content = path.read_text(encoding="utf-8")
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
+            data = json_io.loads(content)
+        except ValueError as e:
+            # JSONDecodeError, or UnicodeDecodeError for non-UTF-8 content
             raise LockfileCorruptedError(f"JSON parse error: {e}")
 
         return cls._from_dict(data)
@@ -66,30 +98,21 @@ class Lockfile:
         if not isinstance(data, dict):
             raise LockfileCorruptedError("Root must be an object")
 
-        version = data.get("version")
-        if not version:
-            raise LockfileCorruptedError("Missing required field: version")
+        version = require(data, "version", LockfileCorruptedError)
 
         raw_assets = data.get("assets", {})
         if not isinstance(raw_assets, dict):
             raise LockfileCorruptedError("assets must be an object")
 
         assets: dict[str, LockedAsset] = {}
-        for name, spec in raw_assets.items():
+        for raw_name, spec in raw_assets.items():
+            # Names repeat across manifest, lockfile and dict keys; share one copy
+            name = sys.intern(raw_name)
             if not isinstance(spec, dict):
                 raise LockfileCorruptedError(f"Asset '{name}' must be an object")
 
-            url = spec.get("url")
-            if not url:
-                raise LockfileCorruptedError(
-                    f"Asset '{name}' missing required field: url"
-                )
-
-            sha256 = spec.get("sha256")
-            if not sha256:
-                raise LockfileCorruptedError(
-                    f"Asset '{name}' missing required field: sha256"
-                )
+            url = require(spec, "url", LockfileCorruptedError, name)
+            sha256 = require(spec, "sha256", LockfileCorruptedError, name)
 
             files = spec.get("files", [])
             if not isinstance(files, list):
@@ -104,11 +127,13 @@ class Lockfile:
 
         return cls(version=version, assets=assets)
 
-    def save(self, path: Path) -> None:
+    def save(self, path: Path, *, pretty: bool = True) -> None:
         """Save lockfile to a JSON file.
 
         Args:
             path: Path to write gda.lock.
+            pretty: Indent the output. gda.lock is committed and reviewed,
+                so this is on by default.
         """
         data = {
             "version": self.version,
@@ -121,7 +146,4 @@ class Lockfile:
                 for name, asset in self.assets.items()
             },
         }
-        path.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
+        path.write_bytes(json_io.dumps(data, indent=pretty))
@@ -1,15 +1,114 @@
 """Manifest model representing gda.yml configuration."""
 
+import functools
+import sys
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from gda.errors import ManifestNotFoundError, ManifestValidationError
+from gda.models._validate import require
+
+
+@functools.cache
+def _yaml_codec() -> tuple[Any, Any]:
+    """Import PyYAML on first use, preferring the libyaml-backed classes.
+
+    Deferred so that importing gda.models for lockfile work alone does not
+    pay for loading PyYAML.
+
+    Returns:
+        (Loader, Dumper) classes for safe YAML handling.
+    """
+    import yaml
+
+    try:
+        return yaml.CSafeLoader, yaml.CSafeDumper
+    except AttributeError:  # PyYAML built without libyaml
+        return yaml.SafeLoader, yaml.SafeDumper
+
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_NULL_TAG = "tag:yaml.org,2002:null"
+_MERGE_TAG = "tag:yaml.org,2002:merge"
+
+
+def _scan_header(
+    events: Iterator[Any], resolver: Any, fields: tuple[str, ...]
+) -> dict[str, str | None] | None:
+    """Collect top-level string values for the given keys from parser events.
+
+    Only plain string and null scalars are read. Anything whose loaded value
+    the events alone cannot give (aliases or merge keys at the top level,
+    or a wanted field holding another type) makes the scan give up, so the
+    caller can fall back to a full load.
+
+    Args:
+        events: Events from yaml.parse.
+        resolver: Resolver used to tag plain scalars.
+        fields: Top-level keys to collect; scanning stops once all are seen.
+
+    Returns:
+        Map of found keys to their value (None for null), or None if the
+        header cannot be read from events.
+
+    Raises:
+        ManifestValidationError: If the root is not a mapping.
+    """
+    import yaml
 
+    found: dict[str, str | None] = {}
+    depth = 0
+    key: str | None = None
+    expecting_key = True
 
-@dataclass
+    for event in events:
+        if isinstance(event, yaml.CollectionEndEvent):
+            depth -= 1
+            continue
+        if isinstance(event, yaml.CollectionStartEvent):
+            depth += 1
+            if depth == 1:
+                if not isinstance(event, yaml.MappingStartEvent):
+                    raise ManifestValidationError("Root must be a mapping")
+                continue
+            if depth != 2:
+                continue
+        elif not isinstance(event, yaml.NodeEvent) or depth != 1:
+            continue
+
+        # event is a node directly under the root mapping
+        if isinstance(event, yaml.AliasEvent):
+            return None
+        tag: str | None = None
+        if isinstance(event, yaml.ScalarEvent):
+            tag = event.tag
+            if tag is None or tag == "!":
+                tag = resolver.resolve(yaml.ScalarNode, event.value, event.implicit)
+
+        if expecting_key:
+            if tag == _MERGE_TAG:
+                return None
+            key = event.value if tag == _STR_TAG else None
+            expecting_key = False
+            continue
+        expecting_key = True
+        if key not in fields:
+            continue
+        if tag == _STR_TAG:
+            found[key] = event.value
+        elif tag == _NULL_TAG:
+            found[key] = None
+        else:
+            return None
+        if len(found) == len(fields):
+            break
+
+    return found
+
+
+@dataclass(slots=True)
 class Asset:
     """Asset definition in the manifest."""
 
@@ -19,7 +118,7 @@ class Asset:
     excludes: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Manifest:
     """Manifest configuration from gda.yml."""
 
@@ -44,14 +143,75 @@ class Manifest:
         if not path.exists():
             raise ManifestNotFoundError(str(path))
 
+        # libyaml detects the encoding itself, so skip decoding here
+        return cls.loads(path.read_bytes())
+
+    @classmethod
+    def loads(cls, content: bytes | str) -> "Manifest":
+        """Parse manifest content already in memory.
+
+        Args:
+            content: YAML document, as bytes or text.
+
+        Returns:
+            Parsed Manifest.
+
+        Raises:
+            ManifestValidationError: If the content is invalid.
+        """
+        import yaml
+
+        loader, _dumper = _yaml_codec()
         try:
-            content = path.read_text(encoding="utf-8")
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=loader)
         except yaml.YAMLError as e:
             raise ManifestValidationError(f"YAML parse error: {e}")
 
         return cls._from_dict(data)
 
+    @classmethod
+    def load_header(cls, path: Path) -> tuple[str, str]:
+        """Read only the repository and version from a YAML file.
+
+        Walks parser events and stops once both top-level keys have been
+        seen, so a large assets mapping is never parsed or constructed.
+        Headers the events cannot resolve (aliases, merge keys, non-string
+        values) are read with a full load, so both always agree.
+
+        Args:
+            path: Path to gda.yml.
+
+        Returns:
+            (repository, version) tuple.
+
+        Raises:
+            ManifestNotFoundError: If the file does not exist.
+            ManifestValidationError: If either field is missing.
+        """
+        if not path.exists():
+            raise ManifestNotFoundError(str(path))
+
+        import yaml
+
+        loader, _dumper = _yaml_codec()
+        try:
+            with open(path, "rb") as f:
+                header = _scan_header(
+                    yaml.parse(f, Loader=loader),
+                    yaml.resolver.Resolver(),
+                    ("repository", "version"),
+                )
+        except yaml.YAMLError as e:
+            raise ManifestValidationError(f"YAML parse error: {e}")
+
+        if header is None:
+            manifest = cls.load(path)
+            return manifest.repository, manifest.version
+
+        repository = require(header, "repository", ManifestValidationError)
+        version = require(header, "version", ManifestValidationError)
+        return repository, version
+
     @classmethod
     def _from_dict(cls, data: Any) -> "Manifest":
         """Parse manifest from dictionary.
@@ -68,13 +228,8 @@ class Manifest:
         if not isinstance(data, dict):
             raise ManifestValidationError("Root must be a mapping")
 
-        repository = data.get("repository")
-        if not repository:
-            raise ManifestValidationError("Missing required field: repository")
-
-        version = data.get("version")
-        if not version:
-            raise ManifestValidationError("Missing required field: version")
+        repository = require(data, "repository", ManifestValidationError)
+        version = require(data, "version", ManifestValidationError)
 
         raw_assets = data.get("assets", {})
         if not isinstance(raw_assets, dict):
@@ -82,15 +237,14 @@ class Manifest:
 
         assets: dict[str, Asset] = {}
         for name, spec in raw_assets.items():
+            # Names repeat across manifest, lockfile and dict keys; share one copy
+            if isinstance(name, str):
+                name = sys.intern(name)
             if not isinstance(spec, dict):
                 raise ManifestValidationError(f"Asset '{name}' must be a mapping")
 
             source = spec.get("source") or name
-            destination = spec.get("destination")
-            if not destination:
-                raise ManifestValidationError(
-                    f"Asset '{name}' missing required field: destination"
-                )
+            destination = require(spec, "destination", ManifestValidationError, name)
 
             excludes = spec.get("excludes", [])
             if not isinstance(excludes, list):
@@ -123,7 +277,17 @@ class Manifest:
                 for name, asset in self.assets.items()
             },
         }
-        path.write_text(
-            yaml.dump(data, default_flow_style=False, allow_unicode=True),
-            encoding="utf-8",
-        )
+        import yaml
+
+        _loader, dumper = _yaml_codec()
+        # Emit straight into the file rather than building an intermediate str
+        with open(path, "wb") as f:
+            yaml.dump(
+                data,
+                f,
+                Dumper=dumper,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+                encoding="utf-8",
+            )
@@ -29,6 +29,18 @@ class ArchiveServiceProtocol(Protocol):
         """
         ...
 
+    def fingerprint(self, source_dir: Path, excludes: list[str] | None = None) -> str:
+        """Compute a cheap fingerprint of a source tree.
+
+        Args:
+            source_dir: Directory that would be archived.
+            excludes: Glob patterns to exclude.
+
+        Returns:
+            Hex digest over file paths, sizes and modification times.
+        """
+        ...
+
     def extract_zip(self, zip_path: Path, dest_dir: Path) -> list[str]:
         """Extract a ZIP archive.
 
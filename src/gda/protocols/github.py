@@ -1,11 +1,11 @@
 """GitHub client protocol definition."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Protocol
 
 
-@dataclass
+@dataclass(slots=True)
 class AssetInfo:
     """GitHub release asset metadata."""
 
@@ -15,7 +15,7 @@ class AssetInfo:
     content_type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ReleaseInfo:
     """GitHub release metadata."""
 
@@ -23,6 +23,7 @@ class ReleaseInfo:
     tag_name: str
     name: str
     assets: list[AssetInfo]
+    etag: str | None = field(default=None, compare=False)
 
 
 class GitHubClientProtocol(Protocol):
@@ -44,6 +45,25 @@ class GitHubClientProtocol(Protocol):
         """
         ...
 
+    def get_release_if_modified(
+        self, repo: str, tag: str, etag: str
+    ) -> ReleaseInfo | None:
+        """Get release information unless it matches a known ETag.
+
+        Args:
+            repo: Repository in "owner/repo" format.
+            tag: Release tag name.
+            etag: ETag of a previously fetched copy of the release.
+
+        Returns:
+            Release metadata, or None if the release is unchanged.
+
+        Raises:
+            ReleaseNotFoundError: If the release does not exist.
+            GitHubAPIError: If the API call fails.
+        """
+        ...
+
     def download_asset(self, url: str, dest: Path) -> None:
         """Download a release asset.
 
@@ -56,6 +76,21 @@ class GitHubClientProtocol(Protocol):
         """
         ...
 
+    def download_and_hash(self, url: str, dest: Path) -> str:
+        """Download a release asset, hashing it in the same pass.
+
+        Args:
+            url: Asset download URL.
+            dest: Destination file path.
+
+        Returns:
+            SHA256 hex digest of the downloaded content.
+
+        Raises:
+            GitHubAPIError: If the download fails.
+        """
+        ...
+
     def get_asset_hash(self, url: str) -> str:
         """Get SHA256 hash of a remote asset.
 
@@ -105,3 +140,27 @@ class GitHubClientProtocol(Protocol):
             GitHubAPIError: If the upload fails.
         """
         ...
+
+    def upload_asset_stream(
+        self, repo: str, release_id: int, name: str, path: Path, content_type: str
+    ) -> AssetInfo:
+        """Upload a file to a release without reading it into memory.
+
+        Args:
+            repo: Repository in "owner/repo" format.
+            release_id: Release ID.
+            name: Asset filename.
+            path: Path to the file to upload.
+            content_type: MIME type.
+
+        Returns:
+            Uploaded asset metadata.
+
+        Raises:
+            GitHubAPIError: If the upload fails.
+        """
+        ...
+
+    def close(self) -> None:
+        """Release any resources held by the client, such as HTTP connections."""
+        ...
@@ -2,6 +2,7 @@
 
 from gda.services.archive import ArchiveService
 from gda.services.github import GitHubClient
+from gda.services.release_cache import CachingGitHubClient
 from gda.services.sync import SyncService
 
-__all__ = ["GitHubClient", "ArchiveService", "SyncService"]
+__all__ = ["GitHubClient", "CachingGitHubClient", "ArchiveService", "SyncService"]
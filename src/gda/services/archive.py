@@ -1,17 +1,200 @@
 """Deterministic archive service implementation."""
 
 import fnmatch
+import functools
 import hashlib
+import os
+import re
+import shutil
 import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 # Fixed timestamp for reproducible archives (2020-01-01 00:00:00)
 FIXED_TIMESTAMP = (2020, 1, 1, 0, 0, 0)
 
+# Member metadata pinned so archives are identical on every platform: ZipInfo
+# otherwise records the creating OS (0 on Windows), and these values match
+# what zipfile writes on POSIX, keeping existing archive hashes stable
+CREATE_SYSTEM_UNIX = 3
+MEMBER_EXTERNAL_ATTR = 0o600 << 16  # ?rw-------
+
+# Explicit Deflate level (zlib's default) so archive bytes never depend on
+# library defaults. Alternative Deflate backends (isal, zlib-ng) are not used:
+# they emit different compressed bytes, which would change archive hashes.
+COMPRESS_LEVEL = 6
+
+# Files at least this large are streamed through the writer instead of being
+# read whole and compressed on a worker thread
+STREAM_THRESHOLD = 8 << 20
+
+# Buffer size for streaming large files into the archive
+STREAM_CHUNK_SIZE = 1 << 20
+
+# General purpose flag bit marking UTF-8 encoded member names
+_UTF8_FLAG = 0x800
+
+
+class _ExcludeMatcher:
+    """Exclude patterns compiled once into combined regexes.
+
+    Equivalent to calling fnmatch.fnmatch for every pattern, but each path
+    is checked with at most two regex matches.
+    """
+
+    def __init__(self, excludes: list[str]) -> None:
+        """Compile exclude patterns.
+
+        Args:
+            excludes: Glob patterns. Patterns starting with "**/" also match
+                against the basename alone.
+        """
+        path_parts: list[str] = []
+        basename_parts: list[str] = []
+        for pattern in excludes:
+            # fnmatch.fnmatch normalizes case the same way
+            pattern = os.path.normcase(pattern)
+            path_parts.append(fnmatch.translate(pattern))
+            if pattern.startswith("**/"):
+                basename_parts.append(fnmatch.translate(pattern[3:]))
+        self._path = self._combine(path_parts)
+        self._basename = self._combine(basename_parts)
+
+    @staticmethod
+    def _combine(parts: list[str]) -> re.Pattern[str] | None:
+        """Join translated patterns into one alternation, if any."""
+        return re.compile("|".join(f"(?:{part})" for part in parts)) if parts else None
+
+    def matches(self, rel_path: str) -> bool:
+        """Check if path matches any exclude pattern.
+
+        Args:
+            rel_path: POSIX relative file path.
+
+        Returns:
+            True if path should be excluded.
+        """
+        if self._basename is not None:
+            basename = os.path.normcase(rel_path.rsplit("/", 1)[-1])
+            if self._basename.match(basename):
+                return True
+        return (
+            self._path is not None
+            and self._path.match(os.path.normcase(rel_path)) is not None
+        )
+
+
+@functools.lru_cache(maxsize=64)
+def _exclude_matcher(excludes: tuple[str, ...]) -> _ExcludeMatcher:
+    """Compile exclude patterns, reusing matchers for repeated pattern lists.
+
+    fingerprint and create_zip walk the same tree with the same excludes, so
+    each pattern list only needs translating once per process.
+    """
+    return _ExcludeMatcher(list(excludes))
+
+
+def _member_name(info: zipfile.ZipInfo) -> str:
+    """Decode a member name, handling UTF-8 and CP932 archives.
+
+    zipfile decodes names as UTF-8 when the UTF-8 flag is set and as CP437
+    otherwise; only the latter may need re-decoding.
+
+    Args:
+        info: Archive member.
+
+    Returns:
+        Decoded member name.
+    """
+    name = info.filename
+    if info.flag_bits & _UTF8_FLAG or name.isascii():
+        return name
+
+    raw = name.encode("cp437")
+    for encoding in ("utf-8", "cp932"):
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return name
+
+
+def _extract_member(zf: zipfile.ZipFile, info: zipfile.ZipInfo, target: Path) -> None:
+    """Stream one archive member to disk through a fixed-size buffer."""
+    with zf.open(info) as src, open(target, "wb") as dst:
+        shutil.copyfileobj(src, dst, STREAM_CHUNK_SIZE)
+
+
+def _deflate_file(path: str) -> tuple[bytes, int, int]:
+    """Read and raw-Deflate a file the same way ZipFile would.
+
+    zlib releases the GIL while compressing, so this scales across threads.
+
+    Args:
+        path: File to compress.
+
+    Returns:
+        (compressed bytes, CRC-32, uncompressed size).
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    payload = compressor.compress(data) + compressor.flush()
+    return payload, zlib.crc32(data), len(data)
+
+
+class _DeterministicZipFile(zipfile.ZipFile):
+    """ZipFile that can append members compressed ahead of time."""
+
+    def write_deflated(
+        self, info: zipfile.ZipInfo, payload: bytes, crc: int, size: int
+    ) -> None:
+        """Append a member whose data is already raw-Deflate compressed.
+
+        Mirrors what writestr does on a seekable file, so the resulting
+        archive bytes are identical.
+
+        Args:
+            info: Member metadata; sizes and CRC are filled in here.
+            payload: Raw Deflate stream from _deflate_file.
+            crc: CRC-32 of the uncompressed data.
+            size: Uncompressed size.
+        """
+        if self.fp is None:
+            raise ValueError("Attempt to write ZIP archive that was already closed")
+
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.flag_bits = 0x00
+        info.CRC = crc
+        info.file_size = size
+        info.compress_size = len(payload)
+
+        zip64 = size * 1.05 > zipfile.ZIP64_LIMIT
+        self.fp.seek(self.start_dir)
+        info.header_offset = self.fp.tell()
+        self.fp.write(info.FileHeader(zip64))
+        self.fp.write(payload)
+        self.start_dir = self.fp.tell()
+
+        self.filelist.append(info)
+        self.NameToInfo[info.filename] = info
+
 
 class ArchiveService:
     """Service for creating and extracting deterministic ZIP archives."""
 
+    def __init__(self, max_workers: int | None = None) -> None:
+        """Initialize the archive service.
+
+        Args:
+            max_workers: Threads used to compress or extract one archive.
+                Defaults to the CPU count; lower it when several archives
+                are built at once in separate processes.
+        """
+        self._max_workers = max_workers
+
     def create_zip(
         self,
         source_dir: Path,
@@ -38,66 +221,113 @@ class ArchiveService:
         # Collect files, sorted for determinism
         files = self._collect_files(source_dir, excludes)
 
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            for file_path in files:
-                rel_path = file_path.relative_to(source_dir)
-                # Create ZipInfo with fixed timestamp and UTF-8 encoding
-                info = zipfile.ZipInfo(
-                    filename=str(rel_path).replace("\\", "/"),
-                    date_time=FIXED_TIMESTAMP,
-                )
-                info.compress_type = zipfile.ZIP_DEFLATED
-
-                with open(file_path, "rb") as f:
-                    zf.writestr(info, f.read())
+        workers = self._max_workers or os.cpu_count() or 1
+        with (
+            _DeterministicZipFile(
+                output_path, "w", zipfile.ZIP_DEFLATED, compresslevel=COMPRESS_LEVEL
+            ) as zf,
+            ThreadPoolExecutor(max_workers=workers) as executor,
+        ):
+            # Compress ahead on worker threads, but write members in sorted
+            # order; the window bounds how much compressed data is held
+            window: deque[
+                tuple[str, os.DirEntry[str], Future[tuple[bytes, int, int]] | None]
+            ] = deque()
+            for rel_path, entry in files:
+                future = None
+                if entry.stat().st_size < STREAM_THRESHOLD:
+                    future = executor.submit(_deflate_file, entry.path)
+                window.append((rel_path, entry, future))
+                if len(window) > 2 * workers:
+                    self._write_member(zf, *window.popleft())
+            while window:
+                self._write_member(zf, *window.popleft())
 
         return self.compute_hash(output_path)
 
-    def _collect_files(self, source_dir: Path, excludes: list[str]) -> list[Path]:
+    def _write_member(
+        self,
+        zf: _DeterministicZipFile,
+        rel_path: str,
+        entry: os.DirEntry[str],
+        future: Future[tuple[bytes, int, int]] | None,
+    ) -> None:
+        """Write one member, streaming it if it was not precompressed."""
+        # Create ZipInfo with fixed timestamp and UTF-8 encoding
+        info = zipfile.ZipInfo(filename=rel_path, date_time=FIXED_TIMESTAMP)
+        info.create_system = CREATE_SYSTEM_UNIX
+        info.external_attr = MEMBER_EXTERNAL_ATTR
+        if future is not None:
+            payload, crc, size = future.result()
+            zf.write_deflated(info, payload, crc, size)
+            return
+
+        info.compress_type = zipfile.ZIP_DEFLATED
+        # ZipFile.open takes the level from the ZipInfo, not the archive;
+        # _compresslevel is untyped but kept as an alias on Python 3.13+
+        info._compresslevel = COMPRESS_LEVEL  # type: ignore[attr-defined]
+        # Known size up front gives the same ZIP64 decision as writestr
+        info.file_size = entry.stat().st_size
+        with open(entry.path, "rb") as src, zf.open(info, "w") as dst:
+            shutil.copyfileobj(src, dst, STREAM_CHUNK_SIZE)
+
+    def _collect_files(
+        self, source_dir: Path, excludes: list[str]
+    ) -> list[tuple[str, os.DirEntry[str]]]:
         """Collect files to archive, respecting excludes.
 
+        Walks the tree with os.scandir, whose entries carry the file type from
+        the directory listing, so no extra stat is needed per entry.
+        Symlinked directories are not followed, matching Path.rglob.
+
         Args:
             source_dir: Source directory.
             excludes: Glob patterns to exclude.
 
         Returns:
-            Sorted list of file paths.
+            (POSIX relative path, directory entry) pairs, sorted by path.
         """
-        files: list[Path] = []
-
-        for file_path in source_dir.rglob("*"):
-            if not file_path.is_file():
-                continue
-
-            rel_path = str(file_path.relative_to(source_dir))
-            if self._matches_exclude(rel_path, excludes):
-                continue
-
-            files.append(file_path)
+        excluded = _exclude_matcher(tuple(excludes))
+        files: list[tuple[str, os.DirEntry[str]]] = []
+        stack = [(os.fspath(source_dir), "")]
+
+        while stack:
+            dir_path, prefix = stack.pop()
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    rel_path = prefix + entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, rel_path + "/"))
+                    elif entry.is_file() and not excluded.matches(rel_path):
+                        files.append((rel_path, entry))
 
         # Sort for deterministic ordering
-        return sorted(files, key=lambda p: str(p.relative_to(source_dir)))
+        files.sort(key=lambda item: item[0])
+        return files
 
-    def _matches_exclude(self, rel_path: str, excludes: list[str]) -> bool:
-        """Check if path matches any exclude pattern.
+    def fingerprint(self, source_dir: Path, excludes: list[str] | None = None) -> str:
+        """Compute a cheap fingerprint of a source tree.
+
+        Only file metadata is read, so an unchanged tree can be detected
+        without reading or compressing any content.
 
         Args:
-            rel_path: Relative file path.
-            excludes: Glob patterns.
+            source_dir: Directory that would be archived.
+            excludes: Glob patterns to exclude.
 
         Returns:
-            True if path should be excluded.
+            Hex digest over file paths, sizes and modification times.
         """
+        excludes = excludes or []
+        hasher = hashlib.sha256()
         for pattern in excludes:
-            # Handle ** patterns by matching basename too
-            if pattern.startswith("**/"):
-                basename_pattern = pattern[3:]
-                basename = rel_path.split("/")[-1]
-                if fnmatch.fnmatch(basename, basename_pattern):
-                    return True
-            if fnmatch.fnmatch(rel_path, pattern):
-                return True
-        return False
+            hasher.update(f"exclude:{pattern}\n".encode())
+
+        for rel_path, entry in self._collect_files(source_dir, excludes):
+            stat = entry.stat()
+            hasher.update(f"{rel_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+
+        return hasher.hexdigest()
 
     def extract_zip(self, zip_path: Path, dest_dir: Path) -> list[str]:
         """Extract a ZIP archive.
@@ -113,27 +343,33 @@ class ArchiveService:
         extracted: list[str] = []
 
         with zipfile.ZipFile(zip_path, "r") as zf:
+            # Later duplicates overwrite earlier ones, as sequential extraction did
+            targets: dict[Path, zipfile.ZipInfo] = {}
             for info in zf.infolist():
                 if info.is_dir():
                     continue
-
-                # Handle UTF-8 and CP932 encoding
-                try:
-                    name = info.filename.encode("cp437").decode("utf-8")
-                except (UnicodeDecodeError, UnicodeEncodeError):
-                    try:
-                        name = info.filename.encode("cp437").decode("cp932")
-                    except (UnicodeDecodeError, UnicodeEncodeError):
-                        name = info.filename
-
-                target = dest_dir / name
-                target.parent.mkdir(parents=True, exist_ok=True)
-
-                with zf.open(info) as src, open(target, "wb") as dst:
-                    dst.write(src.read())
-
+                name = _member_name(info)
+                targets[dest_dir / name] = info
                 extracted.append(name)
 
+            # Create directories up front so workers only write files
+            for parent in {target.parent for target in targets}:
+                parent.mkdir(parents=True, exist_ok=True)
+
+            # Inflation releases the GIL, and zipfile serializes the raw reads
+            workers = max(
+                1, min(self._max_workers or os.cpu_count() or 1, len(targets))
+            )
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Consume results so worker exceptions propagate
+                list(
+                    executor.map(
+                        functools.partial(_extract_member, zf),
+                        targets.values(),
+                        targets,
+                    )
+                )
+
         return sorted(extracted)
 
     def compute_hash(self, file_path: Path) -> str:
@@ -145,11 +381,8 @@ class ArchiveService:
         Returns:
             SHA256 hex digest.
         """
-        hasher = hashlib.sha256()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+            return hashlib.file_digest(f, "sha256").hexdigest()
 
     def list_zip_contents(self, zip_path: Path) -> list[str]:
         """List contents of a ZIP archive.
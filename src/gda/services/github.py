@@ -1,15 +1,37 @@
 """GitHub client implementation using httpx."""
 
 import hashlib
+import importlib.util
 import os
+import threading
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import httpx
 
+from gda import json_io
 from gda.errors import GitHubAPIError, ReleaseNotFoundError
 from gda.protocols.github import AssetInfo, ReleaseInfo
 
+# Read size when hashing remote assets; large chunks keep SHA256 in C
+HASH_CHUNK_SIZE = 1 << 20
+
+# Pooled connections; enough for every concurrent pull worker to keep one alive
+MAX_CONNECTIONS = 16
+
+# HTTP/2 multiplexes requests over one connection but needs the optional h2
+# package, so it is only enabled when that is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Asset fields in AssetInfo order, fetched in one call per asset
+_ASSET_FIELDS = itemgetter("name", "browser_download_url", "size", "content_type")
+
+
+def _asset_info(data: dict[str, Any]) -> AssetInfo:
+    """Build AssetInfo from an API asset object."""
+    return AssetInfo(*_ASSET_FIELDS(data))
+
 
 class GitHubClient:
     """GitHub API client using httpx."""
@@ -27,21 +49,33 @@ class GitHubClient:
             token or os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
         )
         self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
 
     @property
     def client(self) -> httpx.Client:
-        """Get or create HTTP client."""
-        if self._client is None:
-            headers = {
-                "Accept": "application/vnd.github+json",
-                "X-GitHub-Api-Version": "2022-11-28",
-            }
-            if self.token:
-                headers["Authorization"] = f"Bearer {self.token}"
-            self._client = httpx.Client(
-                headers=headers, timeout=30.0, follow_redirects=True
-            )
-        return self._client
+        """Get or create HTTP client.
+
+        The client is shared across threads, so creation is guarded by a lock.
+        """
+        with self._client_lock:
+            if self._client is None:
+                headers = {
+                    "Accept": "application/vnd.github+json",
+                    "X-GitHub-Api-Version": "2022-11-28",
+                }
+                if self.token:
+                    headers["Authorization"] = f"Bearer {self.token}"
+                self._client = httpx.Client(
+                    headers=headers,
+                    timeout=30.0,
+                    follow_redirects=True,
+                    http2=HTTP2_AVAILABLE,
+                    limits=httpx.Limits(
+                        max_connections=MAX_CONNECTIONS,
+                        max_keepalive_connections=MAX_CONNECTIONS,
+                    ),
+                )
+            return self._client
 
     def close(self) -> None:
         """Close the HTTP client."""
@@ -63,28 +97,51 @@ class GitHubClient:
             ReleaseNotFoundError: If the release does not exist.
             GitHubAPIError: If the API call fails.
         """
+        release = self._fetch_release(repo, tag, {})
+        if release is None:
+            raise GitHubAPIError(304, "Unexpected Not Modified response")
+        return release
+
+    def get_release_if_modified(
+        self, repo: str, tag: str, etag: str
+    ) -> ReleaseInfo | None:
+        """Get release information unless it matches a known ETag.
+
+        Args:
+            repo: Repository in "owner/repo" format.
+            tag: Release tag name.
+            etag: ETag of a previously fetched copy of the release.
+
+        Returns:
+            Release metadata, or None if the release is unchanged.
+
+        Raises:
+            ReleaseNotFoundError: If the release does not exist.
+            GitHubAPIError: If the API call fails.
+        """
+        return self._fetch_release(repo, tag, {"If-None-Match": etag})
+
+    def _fetch_release(
+        self, repo: str, tag: str, headers: dict[str, str]
+    ) -> ReleaseInfo | None:
+        """Fetch a release by tag, returning None on 304 Not Modified."""
         url = f"{self.GITHUB_API_URL}/repos/{repo}/releases/tags/{tag}"
-        response = self.client.get(url)
+        response = self.client.get(url, headers=headers)
 
+        if response.status_code == 304:
+            return None
         if response.status_code == 404:
             raise ReleaseNotFoundError(repo, tag)
         if response.status_code != 200:
             raise GitHubAPIError(response.status_code, response.text)
 
-        data = response.json()
-        return self._parse_release(data)
+        release = self._parse_release(json_io.loads(response.content))
+        release.etag = response.headers.get("ETag")
+        return release
 
     def _parse_release(self, data: dict[str, Any]) -> ReleaseInfo:
         """Parse release data from API response."""
-        assets = [
-            AssetInfo(
-                name=asset["name"],
-                url=asset["browser_download_url"],
-                size=asset["size"],
-                content_type=asset["content_type"],
-            )
-            for asset in data.get("assets", [])
-        ]
+        assets = [_asset_info(asset) for asset in data.get("assets", ())]
         return ReleaseInfo(
             id=data["id"],
             tag_name=data["tag_name"],
@@ -99,19 +156,38 @@ class GitHubClient:
             url: Asset download URL.
             dest: Destination file path.
 
+        Raises:
+            GitHubAPIError: If the download fails.
+        """
+        self.download_and_hash(url, dest)
+
+    def download_and_hash(self, url: str, dest: Path) -> str:
+        """Download a release asset, hashing it as it is written.
+
+        Args:
+            url: Asset download URL.
+            dest: Destination file path.
+
+        Returns:
+            SHA256 hex digest of the downloaded content.
+
         Raises:
             GitHubAPIError: If the download fails.
         """
         dest.parent.mkdir(parents=True, exist_ok=True)
+        hasher = hashlib.sha256()
 
         with self.client.stream("GET", url) as response:
             if response.status_code != 200:
                 raise GitHubAPIError(response.status_code, f"Failed to download {url}")
 
             with open(dest, "wb") as f:
-                for chunk in response.iter_bytes(chunk_size=8192):
+                for chunk in response.iter_bytes(chunk_size=HASH_CHUNK_SIZE):
+                    hasher.update(chunk)
                     f.write(chunk)
 
+        return hasher.hexdigest()
+
     def get_asset_hash(self, url: str) -> str:
         """Get SHA256 hash of a remote asset.
 
@@ -130,7 +206,7 @@ class GitHubClient:
             if response.status_code != 200:
                 raise GitHubAPIError(response.status_code, f"Failed to fetch {url}")
 
-            for chunk in response.iter_bytes(chunk_size=8192):
+            for chunk in response.iter_bytes(chunk_size=HASH_CHUNK_SIZE):
                 hasher.update(chunk)
 
         return hasher.hexdigest()
@@ -158,7 +234,7 @@ class GitHubClient:
         if response.status_code not in (200, 201):
             raise GitHubAPIError(response.status_code, response.text)
 
-        return self._parse_release(response.json())
+        return self._parse_release(json_io.loads(response.content))
 
     def upload_asset(
         self, repo: str, release_id: int, name: str, content: bytes, content_type: str
@@ -178,6 +254,39 @@ class GitHubClient:
         Raises:
             GitHubAPIError: If the upload fails.
         """
+        return self._post_asset(repo, release_id, name, content, content_type)
+
+    def upload_asset_stream(
+        self, repo: str, release_id: int, name: str, path: Path, content_type: str
+    ) -> AssetInfo:
+        """Upload a file to a release without reading it into memory.
+
+        Args:
+            repo: Repository in "owner/repo" format.
+            release_id: Release ID.
+            name: Asset filename.
+            path: Path to the file to upload.
+            content_type: MIME type.
+
+        Returns:
+            Uploaded asset metadata.
+
+        Raises:
+            GitHubAPIError: If the upload fails.
+        """
+        # httpx streams file objects in chunks and sets Content-Length from fstat
+        with open(path, "rb") as f:
+            return self._post_asset(repo, release_id, name, f, content_type)
+
+    def _post_asset(
+        self,
+        repo: str,
+        release_id: int,
+        name: str,
+        content: bytes | BinaryIO,
+        content_type: str,
+    ) -> AssetInfo:
+        """Post asset content to the release uploads endpoint."""
         url = f"https://uploads.github.com/repos/{repo}/releases/{release_id}/assets"
         response = self.client.post(
             url,
@@ -189,10 +298,4 @@ class GitHubClient:
         if response.status_code not in (200, 201):
             raise GitHubAPIError(response.status_code, response.text)
 
-        data = response.json()
-        return AssetInfo(
-            name=data["name"],
-            url=data["browser_download_url"],
-            size=data["size"],
-            content_type=data["content_type"],
-        )
+        return _asset_info(json_io.loads(response.content))
@@ -0,0 +1,209 @@
+"""Caching GitHub client that persists release metadata on disk."""
+
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+from gda import json_io
+from gda.protocols.github import AssetInfo, GitHubClientProtocol, ReleaseInfo
+
+
+class CachingGitHubClient:
+    """GitHub client wrapper caching release metadata and asset hashes.
+
+    Each release is stored as ``<cache_dir>/<owner>/<repo>/<tag>.json`` with its
+    ETag and the SHA256 of every asset hashed so far. Cached releases are
+    revalidated with ``If-None-Match``; when the release has changed, its
+    cached asset hashes are discarded.
+    """
+
+    def __init__(self, inner: GitHubClientProtocol, cache_dir: Path) -> None:
+        """Initialize caching client.
+
+        Args:
+            inner: Client performing the actual GitHub API calls.
+            cache_dir: Directory holding cached release metadata.
+        """
+        self.inner = inner
+        self.cache_dir = cache_dir
+        self._releases: dict[tuple[str, str], ReleaseInfo] = {}
+        self._hashes: dict[tuple[str, str], dict[str, str]] = {}
+        self._url_keys: dict[str, tuple[str, str]] = {}
+
+    def _cache_path(self, key: tuple[str, str]) -> Path:
+        """Return the cache file path for a release."""
+        repo, tag = key
+        return self.cache_dir / repo / f"{quote(tag, safe='')}.json"
+
+    def _load(self, key: tuple[str, str]) -> tuple[ReleaseInfo, dict[str, str]] | None:
+        """Load a cached release and its asset hashes, if usable."""
+        try:
+            data = json_io.loads(self._cache_path(key).read_bytes())
+            return self._parse(data), dict(data["hashes"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _parse(self, data: dict[str, Any]) -> ReleaseInfo:
+        """Rebuild ReleaseInfo from a cached entry."""
+        raw = data["release"]
+        return ReleaseInfo(
+            id=raw["id"],
+            tag_name=raw["tag_name"],
+            name=raw["name"],
+            assets=[AssetInfo(**asset) for asset in raw["assets"]],
+            etag=raw["etag"],
+        )
+
+    def _save(self, key: tuple[str, str]) -> None:
+        """Persist a release and its known asset hashes."""
+        release = self._releases[key]
+        if not release.etag:
+            return
+        path = self._cache_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"release": asdict(release), "hashes": self._hashes[key]}
+        path.write_bytes(json_io.dumps(data, indent=False))
+
+    def get_release(self, repo: str, tag: str) -> ReleaseInfo:
+        """Get release information, revalidating any cached copy.
+
+        Args:
+            repo: Repository in "owner/repo" format.
+            tag: Release tag name.
+
+        Returns:
+            Release metadata.
+
+        Raises:
+            ReleaseNotFoundError: If the release does not exist.
+            GitHubAPIError: If the API call fails.
+        """
+        key = (repo, tag)
+        cached = self._load(key)
+
+        release: ReleaseInfo | None = None
+        hashes: dict[str, str] = {}
+        if cached is not None and cached[0].etag:
+            release = self.inner.get_release_if_modified(repo, tag, cached[0].etag)
+            if release is None:
+                release, hashes = cached
+        if release is None:
+            release = self.inner.get_release(repo, tag)
+
+        self._releases[key] = release
+        self._hashes[key] = hashes
+        for asset in release.assets:
+            self._url_keys[asset.url] = key
+        if cached is None or release is not cached[0]:
+            self._save(key)
+        return release
+
+    def get_release_if_modified(
+        self, repo: str, tag: str, etag: str
+    ) -> ReleaseInfo | None:
+        """Get release information unless it matches a known ETag.
+
+        Args:
+            repo: Repository in "owner/repo" format.
+            tag: Release tag name.
+            etag: ETag of a previously fetched copy of the release.
+
+        Returns:
+            Release metadata, or None if the release is unchanged.
+        """
+        return self.inner.get_release_if_modified(repo, tag, etag)
+
+    def download_asset(self, url: str, dest: Path) -> None:
+        """Download a release asset.
+
+        Args:
+            url: Asset download URL.
+            dest: Destination file path.
+        """
+        self.inner.download_asset(url, dest)
+
+    def download_and_hash(self, url: str, dest: Path) -> str:
+        """Download a release asset, hashing it in the same pass.
+
+        Args:
+            url: Asset download URL.
+            dest: Destination file path.
+
+        Returns:
+            SHA256 hex digest of the downloaded content.
+        """
+        return self.inner.download_and_hash(url, dest)
+
+    def get_asset_hash(self, url: str) -> str:
+        """Get SHA256 hash of a remote asset, using the cache when possible.
+
+        Args:
+            url: Asset download URL.
+
+        Returns:
+            SHA256 hex digest.
+        """
+        key = self._url_keys.get(url)
+        hashes = self._hashes.get(key) if key is not None else None
+        if hashes is not None and url in hashes:
+            return hashes[url]
+
+        sha256 = self.inner.get_asset_hash(url)
+        if key is not None and hashes is not None:
+            hashes[url] = sha256
+            self._save(key)
+        return sha256
+
+    def create_release(self, repo: str, tag: str, name: str) -> ReleaseInfo:
+        """Create a new release.
+
+        Args:
+            repo: Repository in "owner/repo" format.
+            tag: Release tag name.
+            name: Release name.
+
+        Returns:
+            Created release metadata.
+        """
+        return self.inner.create_release(repo, tag, name)
+
+    def upload_asset(
+        self, repo: str, release_id: int, name: str, content: bytes, content_type: str
+    ) -> AssetInfo:
+        """Upload an asset to a release.
+
+        Args:
+            repo: Repository in "owner/repo" format.
+            release_id: Release ID.
+            name: Asset filename.
+            content: Asset content bytes.
+            content_type: MIME type.
+
+        Returns:
+            Uploaded asset metadata.
+        """
+        return self.inner.upload_asset(repo, release_id, name, content, content_type)
+
+    def upload_asset_stream(
+        self, repo: str, release_id: int, name: str, path: Path, content_type: str
+    ) -> AssetInfo:
+        """Upload a file to a release without reading it into memory.
+
+        Args:
+            repo: Repository in "owner/repo" format.
+            release_id: Release ID.
+            name: Asset filename.
+            path: Path to the file to upload.
+            content_type: MIME type.
+
+        Returns:
+            Uploaded asset metadata.
+        """
+        return self.inner.upload_asset_stream(
+            repo, release_id, name, path, content_type
+        )
+
+    def close(self) -> None:
+        """Close the wrapped client."""
+        self.inner.close()
@@ -1,5 +1,6 @@
 """Sync service for verifying and synchronizing local state."""
 
+import os
 import shutil
 from pathlib import Path
 
@@ -47,15 +48,27 @@ class SyncService:
             if dest_dir.exists() and dest_dir.is_dir() and not any(dest_dir.iterdir()):
                 return True
             return False
-        if not dest_dir.exists():
+        if not dest_dir.is_dir():
             return False
 
-        for file in asset.files:
-            file_path = dest_dir / file
-            if not file_path.exists():
-                return False
+        # One directory walk instead of a stat per tracked file
+        return self._list_files(dest_dir).issuperset(asset.files)
 
-        return True
+    def _list_files(self, directory: Path) -> set[str]:
+        """List files under a directory.
+
+        Args:
+            directory: Directory to walk.
+
+        Returns:
+            POSIX relative paths of all files, matching lockfile entries.
+        """
+        root = os.fspath(directory)
+        files: set[str] = set()
+        for dir_path, _dir_names, file_names in os.walk(root):
+            prefix = dir_path[len(root) + 1 :].replace(os.sep, "/")
+            files.update(f"{prefix}/{name}" if prefix else name for name in file_names)
+        return files
 
     def pull_asset(
         self,
@@ -85,10 +98,8 @@ class SyncService:
         zip_name = f"{asset.name}.zip"
         zip_path = self._cache_dir / zip_name
 
-        self.github_client.download_asset(asset.url, zip_path)
-
-        # Verify hash
-        actual_hash = self.archive_service.compute_hash(zip_path)
+        # Hash while downloading rather than re-reading the file
+        actual_hash = self.github_client.download_and_hash(asset.url, zip_path)
         if actual_hash != asset.sha256:
             zip_path.unlink()
             raise HashMismatchError(asset.name, asset.sha256, actual_hash)
@@ -102,10 +113,58 @@ class SyncService:
         finally:
             if zip_path.exists():
                 zip_path.unlink()
-            if self._cache_dir.exists() and not any(self._cache_dir.iterdir()):
-                self._cache_dir.rmdir()
         return extracted
 
+    def copy_asset(
+        self, source_dir: Path, dest_dir: Path, files: list[str]
+    ) -> list[str]:
+        """Replace a destination with copies of another asset's files.
+
+        Used when two assets share an archive hash, so the second one does
+        not need to be downloaded and extracted again. Files are copied
+        rather than hardlinked so that editing one destination never
+        changes the other.
+
+        Args:
+            source_dir: Destination of the already pulled asset.
+            dest_dir: Destination to populate.
+            files: Relative paths of the files to copy.
+
+        Returns:
+            List of copied files.
+
+        Raises:
+            ValueError: If one directory is nested inside the other, since
+                clearing the destination would delete source files.
+        """
+        source = Path(os.path.normpath(source_dir))
+        dest = Path(os.path.normpath(dest_dir))
+        if source == dest:
+            # Same directory already holds the files
+            return sorted(files)
+        if source.is_relative_to(dest) or dest.is_relative_to(source):
+            raise ValueError(f"Cannot copy between nested {source} and {dest}")
+
+        if dest_dir.exists():
+            shutil.rmtree(dest_dir)
+        dest_dir.mkdir(parents=True)
+
+        for file in files:
+            target = dest_dir / file
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(source_dir / file, target)
+
+        return sorted(files)
+
+    def cleanup_cache(self) -> None:
+        """Remove the download cache directory if it is empty.
+
+        Called once after all pulls complete, since assets may be pulled
+        concurrently into the same cache directory.
+        """
+        if self._cache_dir.exists() and not any(self._cache_dir.iterdir()):
+            self._cache_dir.rmdir()
+
     def pull_all(
         self,
         lockfile: Lockfile,
@@ -126,22 +185,28 @@ class SyncService:
         """
         results: dict[str, list[str]] = {}
 
-        for name, asset in lockfile.assets.items():
-            dest_dir = asset_destinations.get(name)
-            if dest_dir is None:
-                continue
+        try:
+            for name, asset in lockfile.assets.items():
+                dest_dir = asset_destinations.get(name)
+                if dest_dir is None:
+                    continue
 
-            files = self.pull_asset(asset, dest_dir, force=force)
-            results[name] = files
+                files = self.pull_asset(asset, dest_dir, force=force)
+                results[name] = files
 
-            if prune:
-                self._prune_directory(dest_dir, set(files))
+                if prune:
+                    self._prune_directory(dest_dir, set(files))
+        finally:
+            self.cleanup_cache()
 
         return results
 
     def _prune_directory(self, directory: Path, keep_files: set[str]) -> None:
         """Remove files not in the keep set.
 
+        Walks the tree once with os.walk, removing stray files and then any
+        directories left empty.
+
         Args:
             directory: Directory to prune.
             keep_files: Set of relative file paths to keep.
@@ -149,15 +214,19 @@ class SyncService:
         if not directory.exists():
             return
 
-        for file_path in directory.rglob("*"):
-            if not file_path.is_file():
-                continue
-
-            rel_path = str(file_path.relative_to(directory))
-            if rel_path not in keep_files:
-                file_path.unlink()
-
-        # Remove empty directories
-        for dir_path in sorted(directory.rglob("*"), reverse=True):
-            if dir_path.is_dir() and not any(dir_path.iterdir()):
-                dir_path.rmdir()
+        # Bottom-up, so directories are visited after everything inside them
+        root = os.fspath(directory)
+        for dir_path, _dir_names, file_names in os.walk(root, topdown=False):
+            # Lockfile entries are POSIX paths from the archive
+            prefix = dir_path[len(root) + 1 :].replace(os.sep, "/")
+            for name in file_names:
+                rel_path = f"{prefix}/{name}" if prefix else name
+                if rel_path in keep_files:
+                    continue
+                file_path = os.path.join(dir_path, name)
+                if os.path.isfile(file_path):
+                    os.unlink(file_path)
+
+            # Remove empty directories
+            if dir_path != root and not os.listdir(dir_path):
+                os.rmdir(dir_path)
@@ -9,13 +9,13 @@ from gda.main import app
 from gda.services.archive import ArchiveService
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def cli_runner() -> CliRunner:
     """Provide a CLI runner for testing Typer commands."""
     return CliRunner()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def typer_app() -> Typer:
     """Return the Typer application under test."""
     return app
@@ -27,20 +27,22 @@ def mock_github_client() -> MockGitHubClient:
     return MockGitHubClient()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def archive_service() -> ArchiveService:
     """Provide an archive service for testing."""
     return ArchiveService()
 
 
-@pytest.fixture()
-def app_with_mocks(mock_github_client: MockGitHubClient) -> Typer:
-    """Return app with mock services injected via callback override."""
+@pytest.fixture(scope="session")
+def _mock_app() -> tuple[Typer, dict[str, MockGitHubClient]]:
+    """Build the mock-wired app once, with a slot for the current mock client."""
     import typer
 
     from gda.context import AppContext
     from gda.services.archive import ArchiveService
 
+    current: dict[str, MockGitHubClient] = {}
+
     test_app = typer.Typer(
         name="gda",
         help="GitHub Data Assets - Test App",
@@ -49,10 +51,12 @@ def app_with_mocks(mock_github_client: MockGitHubClient) -> Typer:
 
     @test_app.callback()
     def setup(ctx: typer.Context) -> None:
-        ctx.obj = AppContext(
-            github_client=mock_github_client,
-            archive_service=ArchiveService(),
-        )
+        # Like the real callback, keep a context passed in via invoke(obj=...)
+        if ctx.obj is None:
+            ctx.obj = AppContext(
+                github_client_factory=lambda: current["github"],
+                archive_service_factory=ArchiveService,
+            )
 
     # Register commands from main app
     from gda.main import app
@@ -65,4 +69,15 @@ def app_with_mocks(mock_github_client: MockGitHubClient) -> Typer:
                 hidden=command_info.hidden,
             )(command_info.callback)
 
+    return test_app, current
+
+
+@pytest.fixture()
+def app_with_mocks(
+    _mock_app: tuple[Typer, dict[str, MockGitHubClient]],
+    mock_github_client: MockGitHubClient,
+) -> Typer:
+    """Return app with mock services injected via callback override."""
+    test_app, current = _mock_app
+    current["github"] = mock_github_client
     return test_app
@@ -2,25 +2,34 @@
 
 from pathlib import Path
 
+import pytest
 from typer import Typer
 from typer.testing import CliRunner
 
+from dev.mocks.github import MockGitHubClient
+from gda import json_io
+from gda.context import AppContext
 from gda.main import app
+from gda.services.archive import ArchiveService
+
+# Single-asset manifest shared by the push tests
+_DATA_MANIFEST = b"""
+repository: "owner/repo"
+version: "v1.0.0"
+assets:
+  data:
+    source: "source"
+    destination: "output"
+"""
 
 
 class TestCLIIntegration:
     """Integration tests for CLI command interactions."""
 
-    def test_version_flag_shows_version(self, cli_runner: CliRunner) -> None:
-        """Test that --version flag shows version information."""
-        result = cli_runner.invoke(app, ["--version"])
-
-        assert result.exit_code == 0
-        assert "gda version:" in result.output
-
-    def test_short_version_flag_shows_version(self, cli_runner: CliRunner) -> None:
-        """Test that -V flag shows version information."""
-        result = cli_runner.invoke(app, ["-V"])
+    @pytest.mark.parametrize("flag", ["--version", "-V"])
+    def test_version_flag_shows_version(self, cli_runner: CliRunner, flag: str) -> None:
+        """Test that --version and -V flags show version information."""
+        result = cli_runner.invoke(app, [flag])
 
         assert result.exit_code == 0
         assert "gda version:" in result.output
@@ -102,24 +111,194 @@ class TestPushCommand:
     def test_push_dry_run(self, cli_runner: CliRunner, tmp_path: Path) -> None:
         """Test push with dry-run doesn't upload."""
         manifest_path = tmp_path / "gda.yml"
+        manifest_path.write_bytes(_DATA_MANIFEST)
+
+        # Create source directory
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "file.txt").write_text("content")
+
+        result = cli_runner.invoke(app, ["push", "-m", str(manifest_path), "--dry-run"])
+
+        assert result.exit_code == 0
+        assert "dry run" in result.output.lower()
+
+    def test_push_builds_multiple_archives(
+        self,
+        cli_runner: CliRunner,
+        tmp_path: Path,
+        app_with_mocks: Typer,
+        mock_github_client: MockGitHubClient,
+    ) -> None:
+        """Test push builds several archives and uploads them in manifest order."""
+        manifest_path = tmp_path / "gda.yml"
         manifest_path.write_text("""
 repository: "owner/repo"
 version: "v1.0.0"
 assets:
-  data:
-    source: "source"
-    destination: "output"
+  second:
+    source: "src/second"
+    destination: "out/second"
+  first:
+    source: "src/first"
+    destination: "out/first"
 """)
 
-        # Create source directory
+        for name in ("first", "second"):
+            source = tmp_path / "src" / name
+            source.mkdir(parents=True)
+            (source / f"{name}.txt").write_text(name)
+
+        result = cli_runner.invoke(app_with_mocks, ["push", "-m", str(manifest_path)])
+
+        assert result.exit_code == 0
+        uploaded = [name for _, _, name, _ in mock_github_client.upload_history]
+        assert uploaded == ["second.zip", "first.zip"]
+
+    def test_push_records_uploads_in_session_release_cache(
+        self,
+        cli_runner: CliRunner,
+        tmp_path: Path,
+        app_with_mocks: Typer,
+        mock_github_client: MockGitHubClient,
+    ) -> None:
+        """Test a repeated push sharing one context sees assets it uploaded."""
+        manifest_path = tmp_path / "gda.yml"
+        manifest_path.write_bytes(_DATA_MANIFEST)
         source = tmp_path / "source"
         source.mkdir()
         (source / "file.txt").write_text("content")
 
-        result = cli_runner.invoke(app, ["push", "-m", str(manifest_path), "--dry-run"])
+        context = AppContext(
+            github_client_factory=lambda: mock_github_client,
+            archive_service_factory=ArchiveService,
+        )
+        args = ["push", "-m", str(manifest_path)]
+        first = cli_runner.invoke(app_with_mocks, args, obj=context)
+        second = cli_runner.invoke(app_with_mocks, args, obj=context)
+
+        assert first.exit_code == 0
+        assert second.exit_code == 0
+        assert "Using cached release" in second.output
+        assert "already exists" in second.output
+        assert len(mock_github_client.upload_history) == 1
+        cached = context.release_cache[("owner/repo", "v1.0.0")]
+        assert [asset.name for asset in cached.assets] == ["data.zip"]
+        assert mock_github_client.releases[("owner/repo", "v1.0.0")].assets == []
+
+    def test_push_reuses_unchanged_archive(
+        self, cli_runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """Test push skips rebuilding when the source tree is unchanged."""
+        manifest_path = tmp_path / "gda.yml"
+        manifest_path.write_bytes(_DATA_MANIFEST)
+
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "file.txt").write_text("content")
+
+        args = ["push", "-m", str(manifest_path), "--dry-run"]
+        first = cli_runner.invoke(app, args)
+        second = cli_runner.invoke(app, args)
+        forced = cli_runner.invoke(app, [*args, "--force"])
+
+        assert first.exit_code == 0
+        assert "Built data.zip" in first.output
+        assert second.exit_code == 0
+        assert "unchanged" in second.output
+        assert "Built data.zip" in forced.output
+
+    def test_push_rebuilds_over_truncated_archive(
+        self,
+        cli_runner: CliRunner,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test an archive cut short by an interrupted rebuild is never reused."""
+        manifest_path = tmp_path / "gda.yml"
+        manifest_path.write_bytes(_DATA_MANIFEST)
+
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "file.txt").write_text("content")
+
+        args = ["push", "-m", str(manifest_path), "--dry-run"]
+        assert cli_runner.invoke(app, args).exit_code == 0
+        zip_path = tmp_path / ".gda" / "build" / "data.zip"
+        cache_path = tmp_path / ".gda" / "build" / "data.json"
+        built = zip_path.read_bytes()
+
+        def interrupted(
+            self: ArchiveService, source_dir: Path, output_path: Path, *args: object
+        ) -> str:
+            output_path.write_bytes(built[:10])
+            raise KeyboardInterrupt
+
+        with monkeypatch.context() as patch:
+            patch.setattr(ArchiveService, "create_zip", interrupted)
+            cli_runner.invoke(app, [*args, "--force"])
+        assert not cache_path.exists()
+
+        # Even with the entry back, the changed archive is not reused
+        zip_path.write_bytes(built)
+        assert cli_runner.invoke(app, args).exit_code == 0
+        zip_path.write_bytes(built[:10])
+        retry = cli_runner.invoke(app, args)
+
+        assert retry.exit_code == 0
+        assert "Built data.zip" in retry.output
+        assert zip_path.read_bytes() == built
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_push_rebuilds_over_corrupt_build_cache(
+        self,
+        cli_runner: CliRunner,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        use_orjson: bool,
+    ) -> None:
+        """Test an unreadable build cache entry triggers a rebuild."""
+        if not use_orjson:
+            monkeypatch.setattr(json_io, "_HAS_ORJSON", False)
+        manifest_path = tmp_path / "gda.yml"
+        manifest_path.write_bytes(_DATA_MANIFEST)
+
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "file.txt").write_text("content")
+
+        args = ["push", "-m", str(manifest_path), "--dry-run"]
+        first = cli_runner.invoke(app, args)
+        cache_path = tmp_path / ".gda" / "build" / "data.json"
+        cache_path.write_bytes(b'{"fingerprint":"\xff"}')
+        second = cli_runner.invoke(app, args)
+
+        assert first.exit_code == 0
+        assert second.exit_code == 0
+        assert "Built data.zip" in second.output
+
+    def test_push_uploads_archive(
+        self,
+        cli_runner: CliRunner,
+        tmp_path: Path,
+        app_with_mocks: Typer,
+        mock_github_client: MockGitHubClient,
+    ) -> None:
+        """Test push uploads the built archive from disk."""
+        manifest_path = tmp_path / "gda.yml"
+        manifest_path.write_bytes(_DATA_MANIFEST)
+
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "file.txt").write_text("content")
+
+        result = cli_runner.invoke(app_with_mocks, ["push", "-m", str(manifest_path)])
 
         assert result.exit_code == 0
-        assert "dry run" in result.output.lower()
+        assert len(mock_github_client.upload_history) == 1
+        _repo, _release_id, name, content = mock_github_client.upload_history[0]
+        assert name == "data.zip"
+        assert content == (tmp_path / ".gda" / "build" / "data.zip").read_bytes()
 
 
 class TestInitCommand:
@@ -9,6 +9,15 @@ from typer.testing import CliRunner
 from dev.mocks.github import MockGitHubClient
 from gda.services.archive import ArchiveService
 
+_DATA_MANIFEST = b"""\
+repository: "owner/repo"
+version: "v1.0.0"
+assets:
+  data:
+    source: "source"
+    destination: "output"
+"""
+
 
 def test_pull_bootstraps_lock_and_cleans_cache(
     cli_runner: CliRunner,
@@ -19,16 +28,7 @@ def test_pull_bootstraps_lock_and_cleans_cache(
 ) -> None:
     """Pull without lockfile resolves, installs, and cleans cache."""
     manifest_path = tmp_path / "gda.yml"
-    manifest_path.write_text(
-        """
-repository: "owner/repo"
-version: "v1.0.0"
-assets:
-  data:
-    source: "source"
-    destination: "output"
-""".lstrip()
-    )
+    manifest_path.write_bytes(_DATA_MANIFEST)
 
     source_dir = tmp_path / "source"
     source_dir.mkdir()
@@ -54,3 +54,227 @@ assets:
 
     cache_dir = tmp_path / ".gda" / "cache"
     assert not cache_dir.exists()
+
+
+def test_pull_installs_multiple_assets(
+    cli_runner: CliRunner,
+    tmp_path: Path,
+    app_with_mocks: Typer,
+    mock_github_client: MockGitHubClient,
+    archive_service: ArchiveService,
+) -> None:
+    """Pull installs every asset when several are pulled concurrently."""
+    names = ["alpha", "beta", "gamma"]
+    assets_yaml = "".join(
+        f'  {name}:\n    source: "src/{name}"\n    destination: "out/{name}"\n'
+        for name in names
+    )
+    manifest_path = tmp_path / "gda.yml"
+    manifest_path.write_text(
+        f'repository: "owner/repo"\nversion: "v1.0.0"\nassets:\n{assets_yaml}'
+    )
+
+    release_assets: list[tuple[str, bytes]] = []
+    for name in names:
+        source_dir = tmp_path / "src" / name
+        source_dir.mkdir(parents=True)
+        (source_dir / f"{name}.txt").write_text(name, encoding="utf-8")
+        zip_path = tmp_path / f"{name}.zip"
+        archive_service.create_zip(source_dir, zip_path)
+        release_assets.append((f"{name}.zip", zip_path.read_bytes()))
+    mock_github_client.add_release("owner/repo", "v1.0.0", assets=release_assets)
+
+    result = cli_runner.invoke(app_with_mocks, ["pull", "-m", str(manifest_path)])
+
+    assert result.exit_code == 0
+    for name in names:
+        installed = tmp_path / "out" / name / f"{name}.txt"
+        assert installed.read_text(encoding="utf-8") == name
+
+    lock_data = json.loads((tmp_path / "gda.lock").read_text(encoding="utf-8"))
+    assert lock_data["assets"]["beta"]["files"] == ["beta.txt"]
+    assert not (tmp_path / ".gda" / "cache").exists()
+
+
+def test_pull_downloads_identical_assets_once(
+    cli_runner: CliRunner,
+    tmp_path: Path,
+    app_with_mocks: Typer,
+    mock_github_client: MockGitHubClient,
+    archive_service: ArchiveService,
+) -> None:
+    """Pull copies an asset whose archive hash matches one already pulled."""
+    manifest_path = tmp_path / "gda.yml"
+    manifest_path.write_text(
+        """
+repository: "owner/repo"
+version: "v1.0.0"
+assets:
+  base:
+    source: "source"
+    destination: "out/base"
+  copy:
+    source: "source"
+    destination: "out/copy"
+""".lstrip()
+    )
+
+    source_dir = tmp_path / "source"
+    (source_dir / "nested").mkdir(parents=True)
+    (source_dir / "nested" / "file.txt").write_text("shared", encoding="utf-8")
+    zip_path = tmp_path / "archive.zip"
+    archive_service.create_zip(source_dir, zip_path)
+    content = zip_path.read_bytes()
+    mock_github_client.add_release(
+        "owner/repo",
+        "v1.0.0",
+        assets=[("base.zip", content), ("copy.zip", content)],
+    )
+
+    result = cli_runner.invoke(app_with_mocks, ["pull", "-m", str(manifest_path)])
+
+    assert result.exit_code == 0
+    assert len(mock_github_client.download_history) == 1
+    for name in ("base", "copy"):
+        installed = tmp_path / "out" / name / "nested" / "file.txt"
+        assert installed.read_text(encoding="utf-8") == "shared"
+
+    lock_data = json.loads((tmp_path / "gda.lock").read_text(encoding="utf-8"))
+    assert lock_data["assets"]["copy"]["files"] == ["nested/file.txt"]
+
+
+def test_pull_does_not_copy_from_up_to_date_asset(
+    cli_runner: CliRunner,
+    tmp_path: Path,
+    app_with_mocks: Typer,
+    mock_github_client: MockGitHubClient,
+    archive_service: ArchiveService,
+) -> None:
+    """Pull downloads duplicates afresh when the first asset was not extracted."""
+    names = ["base", "copy", "third"]
+    assets_yaml = "".join(
+        f'  {name}:\n    source: "source"\n    destination: "out/{name}"\n'
+        for name in names
+    )
+    manifest_path = tmp_path / "gda.yml"
+    manifest_path.write_text(
+        f'repository: "owner/repo"\nversion: "v1.0.0"\nassets:\n{assets_yaml}'
+    )
+
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "file.txt").write_text("shared", encoding="utf-8")
+    zip_path = tmp_path / "archive.zip"
+    archive_service.create_zip(source_dir, zip_path)
+    content = zip_path.read_bytes()
+    mock_github_client.add_release(
+        "owner/repo",
+        "v1.0.0",
+        assets=[(f"{name}.zip", content) for name in names],
+    )
+
+    args = ["pull", "-m", str(manifest_path)]
+    assert cli_runner.invoke(app_with_mocks, args).exit_code == 0
+    downloads = len(mock_github_client.download_history)
+
+    # base still verifies (its files exist) but no longer matches the archive
+    (tmp_path / "out" / "base" / "file.txt").write_text("edited", encoding="utf-8")
+    for name in ("copy", "third"):
+        (tmp_path / "out" / name / "file.txt").unlink()
+
+    result = cli_runner.invoke(app_with_mocks, args)
+
+    assert result.exit_code == 0
+    assert len(mock_github_client.download_history) == downloads + 1
+    for name in ("copy", "third"):
+        installed = tmp_path / "out" / name / "file.txt"
+        assert installed.read_text(encoding="utf-8") == "shared"
+
+
+def test_pull_nested_destinations(
+    cli_runner: CliRunner,
+    tmp_path: Path,
+    app_with_mocks: Typer,
+    mock_github_client: MockGitHubClient,
+    archive_service: ArchiveService,
+) -> None:
+    """Pull applies assets with nested destinations in manifest order."""
+    manifest_path = tmp_path / "gda.yml"
+    manifest_path.write_text(
+        """
+repository: "owner/repo"
+version: "v1.0.0"
+assets:
+  outer:
+    source: "src/outer"
+    destination: "out"
+  inner:
+    source: "src/inner"
+    destination: "out/sub"
+  other:
+    source: "src/other"
+    destination: "other"
+""".lstrip()
+    )
+
+    release_assets: list[tuple[str, bytes]] = []
+    for name, count in (("outer", 20), ("inner", 100), ("other", 20)):
+        source_dir = tmp_path / "src" / name
+        source_dir.mkdir(parents=True)
+        for i in range(count):
+            (source_dir / f"{name}{i}.txt").write_text(name, encoding="utf-8")
+        zip_path = tmp_path / f"{name}.zip"
+        archive_service.create_zip(source_dir, zip_path)
+        release_assets.append((f"{name}.zip", zip_path.read_bytes()))
+    mock_github_client.add_release("owner/repo", "v1.0.0", assets=release_assets)
+
+    result = cli_runner.invoke(app_with_mocks, ["pull", "-m", str(manifest_path)])
+
+    assert result.exit_code == 0
+    assert len(list((tmp_path / "out").glob("outer*.txt"))) == 20
+    assert len(list((tmp_path / "out" / "sub").iterdir())) == 100
+    assert len(list((tmp_path / "other").iterdir())) == 20
+
+
+def test_pull_force_identical_assets_same_destination(
+    cli_runner: CliRunner,
+    tmp_path: Path,
+    app_with_mocks: Typer,
+    mock_github_client: MockGitHubClient,
+    archive_service: ArchiveService,
+) -> None:
+    """Pull --force keeps identical assets that share one destination."""
+    manifest_path = tmp_path / "gda.yml"
+    manifest_path.write_text(
+        """
+repository: "owner/repo"
+version: "v1.0.0"
+assets:
+  base:
+    source: "source"
+    destination: "out"
+  copy:
+    source: "source"
+    destination: "out"
+""".lstrip()
+    )
+
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "file.txt").write_text("shared", encoding="utf-8")
+    zip_path = tmp_path / "archive.zip"
+    archive_service.create_zip(source_dir, zip_path)
+    content = zip_path.read_bytes()
+    mock_github_client.add_release(
+        "owner/repo",
+        "v1.0.0",
+        assets=[("base.zip", content), ("copy.zip", content)],
+    )
+
+    args = ["pull", "-m", str(manifest_path)]
+    assert cli_runner.invoke(app_with_mocks, args).exit_code == 0
+    result = cli_runner.invoke(app_with_mocks, [*args, "--force"])
+
+    assert result.exit_code == 0
+    installed = tmp_path / "out" / "file.txt"
+    assert installed.read_text(encoding="utf-8") == "shared"
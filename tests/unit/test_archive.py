@@ -1,20 +1,40 @@
 """Unit tests for archive service."""
 
+import fnmatch
+import zipfile
 from pathlib import Path
 
 import pytest
 
-from gda.services.archive import ArchiveService
+from gda.services import archive as archive_module
+from gda.services.archive import (
+    FIXED_TIMESTAMP,
+    ArchiveService,
+    _ExcludeMatcher,
+    _member_name,
+)
+
+
+@pytest.fixture(scope="module")
+def sample_zip(
+    archive_service: ArchiveService, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Build one archive for tests that only read it."""
+    root = tmp_path_factory.mktemp("sample")
+    source = root / "source"
+    source.mkdir()
+    (source / "file1.txt").write_text("content 1")
+    (source / "subdir").mkdir()
+    (source / "subdir" / "file2.txt").write_text("content 2")
+
+    zip_path = root / "archive.zip"
+    archive_service.create_zip(source, zip_path)
+    return zip_path
 
 
 class TestArchiveService:
     """Tests for ArchiveService."""
 
-    @pytest.fixture
-    def archive_service(self) -> ArchiveService:
-        """Create an archive service."""
-        return ArchiveService()
-
     def test_create_zip_basic(
         self, archive_service: ArchiveService, tmp_path: Path
     ) -> None:
@@ -84,19 +104,28 @@ class TestArchiveService:
         assert hash1 == hash2
         assert output1.read_bytes() == output2.read_bytes()
 
-    def test_extract_zip(self, archive_service: ArchiveService, tmp_path: Path) -> None:
-        """Test extracting a ZIP archive."""
+    def test_create_zip_independent_of_max_workers(
+        self, archive_service: ArchiveService, tmp_path: Path
+    ) -> None:
+        """Test capping compression threads does not change archive bytes."""
         source = tmp_path / "source"
-        source.mkdir()
-        (source / "file1.txt").write_text("content 1")
-        (source / "subdir").mkdir()
-        (source / "subdir" / "file2.txt").write_text("content 2")
+        (source / "sub").mkdir(parents=True)
+        for i in range(8):
+            (source / "sub" / f"file{i}.txt").write_text(f"content {i}" * 100)
+
+        default = tmp_path / "default.zip"
+        single = tmp_path / "single.zip"
+        archive_service.create_zip(source, default)
+        ArchiveService(max_workers=1).create_zip(source, single)
 
-        zip_path = tmp_path / "archive.zip"
-        archive_service.create_zip(source, zip_path)
+        assert single.read_bytes() == default.read_bytes()
 
+    def test_extract_zip(
+        self, archive_service: ArchiveService, sample_zip: Path, tmp_path: Path
+    ) -> None:
+        """Test extracting a ZIP archive."""
         dest = tmp_path / "extracted"
-        files = archive_service.extract_zip(zip_path, dest)
+        files = archive_service.extract_zip(sample_zip, dest)
 
         assert "file1.txt" in files
         assert "subdir/file2.txt" in files
@@ -117,19 +146,175 @@ class TestArchiveService:
         assert len(hash1) == 64
 
     def test_list_zip_contents(
-        self, archive_service: ArchiveService, tmp_path: Path
+        self, archive_service: ArchiveService, sample_zip: Path
     ) -> None:
         """Test listing ZIP contents."""
+        contents = archive_service.list_zip_contents(sample_zip)
+
+        assert contents == ["file1.txt", "subdir/file2.txt"]
+
+    def test_fingerprint_tracks_changes(
+        self, archive_service: ArchiveService, tmp_path: Path
+    ) -> None:
+        """Test fingerprint changes with content and excludes only."""
         source = tmp_path / "source"
         source.mkdir()
         (source / "a.txt").write_text("a")
-        (source / "b.txt").write_text("b")
-        (source / "dir").mkdir()
-        (source / "dir" / "c.txt").write_text("c")
+        (source / "skip.tmp").write_text("tmp")
+
+        base = archive_service.fingerprint(source, ["*.tmp"])
+        assert archive_service.fingerprint(source, ["*.tmp"]) == base
+
+        (source / "skip.tmp").write_text("excluded change")
+        assert archive_service.fingerprint(source, ["*.tmp"]) == base
+        assert archive_service.fingerprint(source) != base
+
+        (source / "a.txt").write_text("changed")
+        assert archive_service.fingerprint(source, ["*.tmp"]) != base
+
+    def test_create_zip_matches_writestr(
+        self, archive_service: ArchiveService, tmp_path: Path
+    ) -> None:
+        """Test precompressed members produce the same bytes as ZipFile.writestr."""
+        source = tmp_path / "source"
+        (source / "ディレクトリ").mkdir(parents=True)
+        (source / "empty.txt").write_bytes(b"")
+        (source / "repeat.txt").write_bytes(b"abc" * 100_000)
+        (source / "ディレクトリ" / "データ.bin").write_bytes(bytes(range(256)) * 40)
+
+        output = tmp_path / "output.zip"
+        archive_service.create_zip(source, output)
+
+        expected = tmp_path / "expected.zip"
+        with zipfile.ZipFile(expected, "w", zipfile.ZIP_DEFLATED) as zf:
+            for rel_path in ["empty.txt", "repeat.txt", "ディレクトリ/データ.bin"]:
+                info = zipfile.ZipInfo(rel_path, date_time=FIXED_TIMESTAMP)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                zf.writestr(info, (source / rel_path).read_bytes())
+
+        assert output.read_bytes() == expected.read_bytes()
+
+    def test_create_zip_pins_member_platform(
+        self, archive_service: ArchiveService, tmp_path: Path
+    ) -> None:
+        """Test member metadata does not depend on the creating OS."""
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "file.txt").write_text("content")
+
+        output = tmp_path / "output.zip"
+        archive_service.create_zip(source, output)
+
+        with zipfile.ZipFile(output) as zf:
+            (info,) = zf.infolist()
+        assert info.create_system == 3
+        assert info.external_attr == 0o600 << 16
+
+    def test_create_zip_streamed_members_match(
+        self,
+        archive_service: ArchiveService,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test streaming large members yields the same archive bytes."""
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "small.txt").write_text("small")
+        (source / "large.bin").write_bytes(b"0123456789" * 50_000)
+
+        precompressed = tmp_path / "precompressed.zip"
+        archive_service.create_zip(source, precompressed)
+
+        monkeypatch.setattr(archive_module, "STREAM_THRESHOLD", 1024)
+        monkeypatch.setattr(archive_module, "STREAM_CHUNK_SIZE", 4096)
+        streamed = tmp_path / "streamed.zip"
+        archive_service.create_zip(source, streamed)
+
+        assert streamed.read_bytes() == precompressed.read_bytes()
+
+    def test_create_zip_streamed_members_use_compress_level(
+        self,
+        archive_service: ArchiveService,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test streamed members are deflated at COMPRESS_LEVEL."""
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "large.bin").write_bytes(bytes(range(256)) * 4096)
+
+        default_level = tmp_path / "default.zip"
+        archive_service.create_zip(source, default_level)
+
+        monkeypatch.setattr(archive_module, "COMPRESS_LEVEL", 1)
+        precompressed = tmp_path / "precompressed.zip"
+        archive_service.create_zip(source, precompressed)
+        monkeypatch.setattr(archive_module, "STREAM_THRESHOLD", 1024)
+        streamed = tmp_path / "streamed.zip"
+        archive_service.create_zip(source, streamed)
+
+        assert precompressed.read_bytes() != default_level.read_bytes()
+        assert streamed.read_bytes() == precompressed.read_bytes()
+
+
+class TestExcludeMatcher:
+    """Tests for compiled exclude patterns."""
+
+    @pytest.mark.parametrize(
+        "rel_path",
+        [
+            ".DS_Store",
+            "sub/.DS_Store",
+            "cache/temp.txt",
+            "cache/nested/temp.txt",
+            "keep.txt",
+            "deep/dir/file.pyc",
+            "build",
+        ],
+    )
+    def test_matches_like_fnmatch(self, rel_path: str) -> None:
+        """Test the combined regex agrees with per-pattern fnmatch."""
+        excludes = ["**/.DS_Store", "cache/*", "*.pyc", "**/build"]
+        expected = any(
+            fnmatch.fnmatch(rel_path, pattern)
+            or (
+                pattern.startswith("**/")
+                and fnmatch.fnmatch(rel_path.split("/")[-1], pattern[3:])
+            )
+            for pattern in excludes
+        )
+
+        assert _ExcludeMatcher(excludes).matches(rel_path) is expected
+
+    def test_no_patterns(self) -> None:
+        """Test nothing is excluded without patterns."""
+        assert not _ExcludeMatcher([]).matches("file.txt")
+
+
+class TestMemberName:
+    """Tests for archive member name decoding."""
+
+    def _info(self, raw: bytes, flag_bits: int = 0) -> zipfile.ZipInfo:
+        """Build a ZipInfo the way zipfile decodes a stored name."""
+        encoding = "utf-8" if flag_bits & 0x800 else "cp437"
+        info = zipfile.ZipInfo(raw.decode(encoding))
+        info.flag_bits = flag_bits
+        return info
+
+    def test_utf8_flag_used_as_is(self) -> None:
+        """Test flagged names are not re-decoded."""
+        assert (
+            _member_name(self._info("é/データ.txt".encode(), 0x800)) == "é/データ.txt"
+        )
 
-        zip_path = tmp_path / "archive.zip"
-        archive_service.create_zip(source, zip_path)
+    def test_unflagged_utf8(self) -> None:
+        """Test UTF-8 names without the flag are recovered."""
+        assert _member_name(self._info("データ.txt".encode())) == "データ.txt"
 
-        contents = archive_service.list_zip_contents(zip_path)
+    def test_unflagged_cp932(self) -> None:
+        """Test CP932 names from legacy archivers are recovered."""
+        assert _member_name(self._info("データ.txt".encode("cp932"))) == "データ.txt"
 
-        assert contents == ["a.txt", "b.txt", "dir/c.txt"]
+    def test_ascii(self) -> None:
+        """Test ASCII names pass through."""
+        assert _member_name(self._info(b"dir/file.txt")) == "dir/file.txt"
@@ -0,0 +1,44 @@
+"""Unit tests for application context."""
+
+from unittest.mock import MagicMock
+
+from gda.context import AppContext
+from gda.services.archive import ArchiveService
+
+
+class TestAppContext:
+    """Tests for AppContext lazy services."""
+
+    def test_github_client_created_once_on_access(self) -> None:
+        """Test the client factory runs lazily and only once."""
+        factory = MagicMock()
+        context = AppContext(
+            github_client_factory=factory, archive_service_factory=ArchiveService
+        )
+
+        factory.assert_not_called()
+        assert context.github_client is context.github_client
+        factory.assert_called_once()
+
+    def test_close_skips_unused_client(self) -> None:
+        """Test close does not create a client just to close it."""
+        factory = MagicMock()
+        context = AppContext(
+            github_client_factory=factory, archive_service_factory=ArchiveService
+        )
+
+        context.close()
+
+        factory.assert_not_called()
+
+    def test_close_closes_created_client(self) -> None:
+        """Test close releases a client that was used."""
+        client = MagicMock()
+        context = AppContext(
+            github_client_factory=lambda: client, archive_service_factory=ArchiveService
+        )
+        _ = context.github_client
+
+        context.close()
+
+        client.close.assert_called_once()
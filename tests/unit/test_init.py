@@ -2,7 +2,12 @@
 
 from pathlib import Path
 
-from gda.commands.init import _ensure_gitignore, _render_manifest, _write_manifest
+from gda.commands.init import (
+    _ensure_gitignore,
+    _gitignore_has_gda,
+    _render_manifest,
+    _write_manifest,
+)
 
 
 class TestInitHelpers:
@@ -45,6 +50,16 @@ class TestInitHelpers:
         assert gitignore.read_text(encoding="utf-8") == content
         assert content.count(".gda/") == 1
 
+    def test_ensure_gitignore_separates_block(self, tmp_path: Path) -> None:
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("dist/", encoding="utf-8")
+
+        _ensure_gitignore(gitignore)
+
+        assert gitignore.read_text(encoding="utf-8") == (
+            "dist/\n\n# GDA cache and build artifacts\n.gda/\n"
+        )
+
     def test_ensure_gitignore_creates_file(self, tmp_path: Path) -> None:
         gitignore = tmp_path / ".gitignore"
 
@@ -53,3 +68,11 @@ class TestInitHelpers:
         assert changed is True
         content = gitignore.read_text(encoding="utf-8")
         assert ".gda/" in content
+
+    def test_gitignore_has_gda_matches_whole_lines(self) -> None:
+        assert _gitignore_has_gda(".gda\n")
+        assert _gitignore_has_gda("dist/\n  .gda/  \nbuild/")
+        assert _gitignore_has_gda("dist/\r\n.gda/\r\n")
+        assert not _gitignore_has_gda(".gdata/\n")
+        assert not _gitignore_has_gda("# .gda/\n")
+        assert not _gitignore_has_gda("")
@@ -0,0 +1,46 @@
+"""Unit tests for JSON helpers."""
+
+import json
+
+import pytest
+
+from gda import json_io
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    """Run each test with and without orjson."""
+    use_orjson: bool = request.param
+    if use_orjson and not json_io._HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(json_io, "_HAS_ORJSON", use_orjson)
+    return use_orjson
+
+
+class TestJsonIO:
+    """Tests for json_io loads/dumps."""
+
+    def test_round_trip(self, backend: bool) -> None:
+        """Test values survive a dumps/loads round trip."""
+        data = {"name": "データ", "files": ["a.txt"], "size": 3}
+
+        assert json_io.loads(json_io.dumps(data)) == data
+
+    def test_dumps_matches_stdlib_layout(self, backend: bool) -> None:
+        """Test output is indented UTF-8 with a trailing newline."""
+        data = {"version": "v1", "assets": {"データ": {"files": []}}}
+
+        expected = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+        assert json_io.dumps(data) == expected.encode("utf-8")
+
+    def test_loads_invalid_raises_json_error(self, backend: bool) -> None:
+        """Test invalid documents raise json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            json_io.loads(b"{ invalid json }")
+
+    def test_dumps_compact(self, backend: bool) -> None:
+        """Test compact output has no insignificant whitespace."""
+        data = {"fingerprint": "abc", "files": ["a b.txt", "データ"]}
+
+        expected = json.dumps(data, separators=(",", ":"), ensure_ascii=False) + "\n"
+        assert json_io.dumps(data, indent=False) == expected.encode("utf-8")
@@ -52,6 +52,16 @@ class TestLockfile:
 
         assert "JSON parse error" in str(exc_info.value)
 
+    def test_load_lockfile_invalid_utf8(self, tmp_path: Path) -> None:
+        """Test loading non-UTF-8 content raises error."""
+        lockfile_path = tmp_path / "gda.lock"
+        lockfile_path.write_bytes(b'{"version": "\xff"}')
+
+        with pytest.raises(LockfileCorruptedError) as exc_info:
+            Lockfile.load(lockfile_path)
+
+        assert "JSON parse error" in str(exc_info.value)
+
     def test_load_lockfile_missing_version(self, tmp_path: Path) -> None:
         """Test lockfile without version field raises error."""
         lockfile_path = tmp_path / "gda.lock"
@@ -118,3 +128,23 @@ class TestLockfile:
 
         lockfile = Lockfile.load(lockfile_path)
         assert lockfile.assets["data"].files == []
+
+    def test_loads_from_memory(self) -> None:
+        """Test parsing lockfile content without touching the filesystem."""
+        lockfile = Lockfile.loads(
+            b'{"version": "v1.0.0", "assets": {"data": '
+            b'{"url": "https://example.com/data.zip", "sha256": "abc"}}}'
+        )
+
+        assert lockfile.version == "v1.0.0"
+        assert lockfile.assets["data"].files == []
+        with pytest.raises(LockfileCorruptedError):
+            Lockfile.loads("{ invalid json }")
+
+    @pytest.mark.parametrize("content", [b"", b"  garbage", b"[]", '"text"'])
+    def test_loads_rejects_non_object(self, content: bytes | str) -> None:
+        """Test content that cannot be an object fails before parsing."""
+        with pytest.raises(LockfileCorruptedError) as exc_info:
+            Lockfile.loads(content)
+
+        assert "expected an object" in str(exc_info.value)
@@ -123,3 +123,123 @@ assets:
         assert loaded.repository == "owner/repo"
         assert loaded.version == "v2.0.0"
         assert loaded.assets["data"].destination == "output/data"
+
+    def test_save_manifest_keeps_field_order(self, tmp_path: Path) -> None:
+        """Test saved manifest lists fields in declaration order."""
+        manifest = Manifest(
+            repository="owner/repo",
+            version="v1.0.0",
+            assets={
+                "データ": Asset(name="データ", source="raw", destination="out"),
+            },
+        )
+
+        output_path = tmp_path / "gda.yml"
+        manifest.save(output_path)
+
+        content = output_path.read_text(encoding="utf-8")
+        assert content.splitlines()[:3] == [
+            "repository: owner/repo",
+            "version: v1.0.0",
+            "assets:",
+        ]
+        assert "データ" in content
+        assert Manifest.load(output_path).assets["データ"].source == "raw"
+
+    def test_load_header_stops_before_assets(self, tmp_path: Path) -> None:
+        """Test load_header reads the header without parsing assets."""
+        manifest_path = tmp_path / "gda.yml"
+        manifest_path.write_text("""
+repository: "owner/repo"
+notes: {kind: header, tags: [a, b]}
+version: v1.0.0
+assets:
+  data: [unterminated
+""")
+
+        assert Manifest.load_header(manifest_path) == ("owner/repo", "v1.0.0")
+        with pytest.raises(ManifestValidationError):
+            Manifest.load(manifest_path)
+
+    def test_load_header_missing_version(self, tmp_path: Path) -> None:
+        """Test load_header rejects a manifest without a version."""
+        manifest_path = tmp_path / "gda.yml"
+        manifest_path.write_text("""
+repository: "owner/repo"
+version: ~
+assets: {}
+""")
+
+        with pytest.raises(ManifestValidationError) as exc_info:
+            Manifest.load_header(manifest_path)
+
+        assert "version" in str(exc_info.value)
+
+    def test_load_header_follows_aliases(self, tmp_path: Path) -> None:
+        """Test aliased top-level values keep keys and values paired."""
+        manifest_path = tmp_path / "gda.yml"
+        manifest_path.write_text(
+            "common: &c foo\nother: *c\nowner: &r owner/repo\n"
+            "repository: *r\nversion: v1\nassets: {}\n"
+        )
+
+        assert Manifest.load_header(manifest_path) == ("owner/repo", "v1")
+
+    @pytest.mark.parametrize(
+        "header",
+        [
+            "repository: owner/repo\nversion: 1.0\n",
+            "repository: owner/repo\nversion: true\n",
+            "repository: owner/repo\nversion: [v1]\n",
+            "base: &b {repository: owner/repo, version: v1}\n<<: *b\n",
+            "base: &b {repository: owner/repo}\n<<: *b\nversion: v2\n",
+        ],
+        ids=["float", "bool", "list", "merge", "partial-merge"],
+    )
+    def test_load_header_agrees_with_load(self, tmp_path: Path, header: str) -> None:
+        """Test load_header returns what load reads for unusual headers."""
+        manifest_path = tmp_path / "gda.yml"
+        manifest_path.write_text(header + "assets: {}\n")
+
+        manifest = Manifest.load(manifest_path)
+
+        assert Manifest.load_header(manifest_path) == (
+            manifest.repository,
+            manifest.version,
+        )
+
+    @pytest.mark.parametrize("version", ["false", "''", "[]"], ids=str)
+    def test_load_header_rejects_like_load(self, tmp_path: Path, version: str) -> None:
+        """Test load_header rejects empty values exactly as load does."""
+        manifest_path = tmp_path / "gda.yml"
+        manifest_path.write_text(
+            f"repository: owner/repo\nversion: {version}\nassets: {{}}\n"
+        )
+
+        with pytest.raises(ManifestValidationError) as load_error:
+            Manifest.load(manifest_path)
+        with pytest.raises(ManifestValidationError) as header_error:
+            Manifest.load_header(manifest_path)
+
+        assert str(header_error.value) == str(load_error.value)
+
+    def test_load_header_quoted_scalars(self, tmp_path: Path) -> None:
+        """Test quoted and explicitly tagged scalars are read as strings."""
+        manifest_path = tmp_path / "gda.yml"
+        manifest_path.write_text(
+            'repository: !!str owner/repo\nversion: "1.10"\nassets: {}\n'
+        )
+
+        assert Manifest.load_header(manifest_path) == ("owner/repo", "1.10")
+
+    def test_loads_from_memory(self) -> None:
+        """Test parsing manifest content without touching the filesystem."""
+        manifest = Manifest.loads(
+            'repository: "owner/repo"\nversion: "v1.0.0"\n'
+            "assets:\n  data:\n    destination: out\n"
+        )
+
+        assert manifest.repository == "owner/repo"
+        assert manifest.assets["data"].source == "data"
+        with pytest.raises(ManifestValidationError):
+            Manifest.loads(b"repository: [unterminated")
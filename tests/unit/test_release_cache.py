@@ -0,0 +1,85 @@
+"""Unit tests for caching GitHub client."""
+
+from pathlib import Path
+
+import pytest
+
+from dev.mocks.github import MockGitHubClient
+from gda.errors import ReleaseNotFoundError
+from gda.services.release_cache import CachingGitHubClient
+
+ASSET_URL = "https://github.com/owner/repo/releases/download/v1.0.0/data.zip"
+
+
+class TestCachingGitHubClient:
+    """Tests for CachingGitHubClient."""
+
+    @pytest.fixture
+    def mock_client(self) -> MockGitHubClient:
+        """Create a mock client with one release."""
+        client = MockGitHubClient()
+        client.add_release("owner/repo", "v1.0.0", assets=[("data.zip", b"data")])
+        return client
+
+    def test_get_release_writes_cache(
+        self, mock_client: MockGitHubClient, tmp_path: Path
+    ) -> None:
+        """Test that fetched releases are persisted."""
+        client = CachingGitHubClient(mock_client, tmp_path)
+
+        release = client.get_release("owner/repo", "v1.0.0")
+
+        assert release.assets[0].name == "data.zip"
+        assert (tmp_path / "owner" / "repo" / "v1.0.0.json").exists()
+
+    def test_asset_hash_reused_while_release_unchanged(
+        self, mock_client: MockGitHubClient, tmp_path: Path
+    ) -> None:
+        """Test that cached hashes survive across client instances."""
+        first = CachingGitHubClient(mock_client, tmp_path)
+        first.get_release("owner/repo", "v1.0.0")
+        expected = first.get_asset_hash(ASSET_URL)
+
+        # Tamper with the remote hash; an unchanged ETag must keep the cache
+        mock_client.asset_hashes[ASSET_URL] = "changed"
+        second = CachingGitHubClient(mock_client, tmp_path)
+        release = second.get_release("owner/repo", "v1.0.0")
+
+        assert release.name == "v1.0.0"
+        assert second.get_asset_hash(ASSET_URL) == expected
+
+    def test_asset_hash_refetched_when_release_changes(
+        self, mock_client: MockGitHubClient, tmp_path: Path
+    ) -> None:
+        """Test that a new ETag invalidates cached hashes."""
+        first = CachingGitHubClient(mock_client, tmp_path)
+        first.get_release("owner/repo", "v1.0.0")
+        first.get_asset_hash(ASSET_URL)
+
+        mock_client.add_release("owner/repo", "v1.0.0", assets=[("data.zip", b"new")])
+        second = CachingGitHubClient(mock_client, tmp_path)
+        second.get_release("owner/repo", "v1.0.0")
+
+        assert second.get_asset_hash(ASSET_URL) == mock_client.asset_hashes[ASSET_URL]
+
+    def test_corrupted_cache_is_ignored(
+        self, mock_client: MockGitHubClient, tmp_path: Path
+    ) -> None:
+        """Test that an unreadable cache entry falls back to the API."""
+        cache_file = tmp_path / "owner" / "repo" / "v1.0.0.json"
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text("{ invalid json }")
+        client = CachingGitHubClient(mock_client, tmp_path)
+
+        release = client.get_release("owner/repo", "v1.0.0")
+
+        assert release.tag_name == "v1.0.0"
+
+    def test_missing_release_raises(
+        self, mock_client: MockGitHubClient, tmp_path: Path
+    ) -> None:
+        """Test that missing releases are not cached."""
+        client = CachingGitHubClient(mock_client, tmp_path)
+
+        with pytest.raises(ReleaseNotFoundError):
+            client.get_release("owner/repo", "v9.9.9")
@@ -0,0 +1,139 @@
+"""Unit tests for sync service."""
+
+from pathlib import Path
+
+import pytest
+
+from dev.mocks.github import MockGitHubClient
+from gda.models.lockfile import LockedAsset
+from gda.services.archive import ArchiveService
+from gda.services.sync import SyncService
+
+
+class TestPruneDirectory:
+    """Tests for SyncService._prune_directory."""
+
+    def test_removes_untracked_files_and_empty_dirs(
+        self,
+        mock_github_client: MockGitHubClient,
+        archive_service: ArchiveService,
+        tmp_path: Path,
+    ) -> None:
+        """Test untracked files go and directories left empty are removed."""
+        dest = tmp_path / "data"
+        (dest / "keep").mkdir(parents=True)
+        (dest / "stray" / "deep").mkdir(parents=True)
+        (dest / "root.txt").write_text("root")
+        (dest / "extra.txt").write_text("extra")
+        (dest / "keep" / "file.txt").write_text("file")
+        (dest / "keep" / "other.txt").write_text("other")
+        (dest / "stray" / "deep" / "junk.txt").write_text("junk")
+
+        sync = SyncService(mock_github_client, archive_service, tmp_path)
+        sync._prune_directory(dest, {"root.txt", "keep/file.txt"})
+
+        assert sorted(p.relative_to(dest).as_posix() for p in dest.rglob("*")) == [
+            "keep",
+            "keep/file.txt",
+            "root.txt",
+        ]
+
+    def test_missing_directory_is_ignored(
+        self,
+        mock_github_client: MockGitHubClient,
+        archive_service: ArchiveService,
+        tmp_path: Path,
+    ) -> None:
+        """Test pruning a directory that does not exist is a no-op."""
+        sync = SyncService(mock_github_client, archive_service, tmp_path)
+
+        sync._prune_directory(tmp_path / "missing", set())
+
+        assert not (tmp_path / "missing").exists()
+
+
+class TestCopyAsset:
+    """Tests for SyncService.copy_asset."""
+
+    def test_same_directory_is_left_alone(
+        self,
+        mock_github_client: MockGitHubClient,
+        archive_service: ArchiveService,
+        tmp_path: Path,
+    ) -> None:
+        """Test copying a directory onto itself keeps its files."""
+        dest = tmp_path / "out"
+        dest.mkdir()
+        (dest / "b.txt").write_text("b")
+        (dest / "a.txt").write_text("a")
+
+        sync = SyncService(mock_github_client, archive_service, tmp_path)
+        files = sync.copy_asset(dest, tmp_path / "out" / ".", ["b.txt", "a.txt"])
+
+        assert files == ["a.txt", "b.txt"]
+        assert (dest / "a.txt").read_text() == "a"
+
+    def test_nested_directories_rejected(
+        self,
+        mock_github_client: MockGitHubClient,
+        archive_service: ArchiveService,
+        tmp_path: Path,
+    ) -> None:
+        """Test copying between nested directories is refused untouched."""
+        source = tmp_path / "out" / "sub"
+        source.mkdir(parents=True)
+        (source / "a.txt").write_text("a")
+
+        sync = SyncService(mock_github_client, archive_service, tmp_path)
+
+        with pytest.raises(ValueError):
+            sync.copy_asset(source, tmp_path / "out", ["a.txt"])
+        with pytest.raises(ValueError):
+            sync.copy_asset(tmp_path / "out", source / "deep", ["sub/a.txt"])
+        assert (source / "a.txt").read_text() == "a"
+
+
+class TestVerifyAsset:
+    """Tests for SyncService.verify_asset."""
+
+    def _asset(self, files: list[str]) -> LockedAsset:
+        """Build a locked asset tracking the given files."""
+        return LockedAsset(
+            name="data.zip",
+            url="https://example.com/data.zip",
+            sha256="0" * 64,
+            files=files,
+        )
+
+    def test_nested_files_present(
+        self,
+        mock_github_client: MockGitHubClient,
+        archive_service: ArchiveService,
+        tmp_path: Path,
+    ) -> None:
+        """Test an asset verifies when all tracked files exist."""
+        dest = tmp_path / "data"
+        (dest / "sub").mkdir(parents=True)
+        (dest / "a.txt").write_text("a")
+        (dest / "sub" / "b.txt").write_text("b")
+        (dest / "untracked.txt").write_text("extra")
+
+        sync = SyncService(mock_github_client, archive_service, tmp_path)
+
+        assert sync.verify_asset(self._asset(["a.txt", "sub/b.txt"]), dest)
+
+    def test_missing_file_fails(
+        self,
+        mock_github_client: MockGitHubClient,
+        archive_service: ArchiveService,
+        tmp_path: Path,
+    ) -> None:
+        """Test an asset fails verification when a tracked file is missing."""
+        dest = tmp_path / "data"
+        dest.mkdir()
+        (dest / "a.txt").write_text("a")
+
+        sync = SyncService(mock_github_client, archive_service, tmp_path)
+
+        assert not sync.verify_asset(self._asset(["a.txt", "sub/b.txt"]), dest)
+        assert not sync.verify_asset(self._asset(["a.txt"]), tmp_path / "missing")